@@ -32,6 +32,9 @@ Animation dict is of structure:
 
 # TODO: DOCUMENT
 
+from collections import OrderedDict
+from itertools import repeat
+
 import pygame
 import logging
 
@@ -40,7 +43,154 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
+class AnimationInfo():
+    """
+    Slotted tracker for animation run-time info.
+
+    Holds the same elements as an animation info dict as attributes, so
+    playback can update it with plain attribute stores. Dict-style access is
+    kept for readers of the dict API.
+    """
+
+    __slots__ = ('animation_name', 'state', 'frame_delay', 'frame',
+                 'frame_delay_index')
+
+    def __init__(self, animation_name="-", state=-1, frame_delay=-1,
+                 frame=-1, frame_delay_index=-1):
+        self.animation_name = animation_name
+        self.state = state
+        self.frame_delay = frame_delay
+        self.frame = frame
+        self.frame_delay_index = frame_delay_index
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __repr__(self):
+        return "AnimationInfo(%s)" % ", ".join(
+            "%s=%r" % (key, getattr(self, key)) for key in self.__slots__
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.__slots__
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+class _DictInfo():
+    """Forward animation info attribute stores to a plain info dict."""
+
+    __slots__ = ('_target',)
+
+    def __init__(self, target):
+        object.__setattr__(self, '_target', target)
+
+    def __setattr__(self, key, value):
+        self._target[key] = value
+
+
+class _NullInfo():
+    """Discard animation info when no info tracker is configured."""
+
+    __slots__ = ()
+
+    def __setattr__(self, key, value):
+        pass
+
+    def __setitem__(self, key, value):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+_NULL_INFO = _NullInfo()
+
+
+def _info_sink(animation_info_dict):
+    """Get an object that takes animation info as attribute stores."""
+    if animation_info_dict is None:
+        return _NULL_INFO
+
+    if isinstance(animation_info_dict, AnimationInfo):
+        return animation_info_dict
+
+    return _DictInfo(animation_info_dict)
+
+
+_EMPTY_SURFACE = None
+
+
+def _empty_surface():
+    """Get the shared placeholder frame used before an animation advances."""
+    global _EMPTY_SURFACE
+
+    if _EMPTY_SURFACE is None:
+        _EMPTY_SURFACE = pygame.Surface((0, 0))
+
+    return _EMPTY_SURFACE
+
+
+def _expand_playback(playback):
+    """
+    Expand a playback list into one entry per displayed tick.
+
+    Returns a tuple of parallel lists of (frame_index, frame_delay,
+    frame_delay_index), so advancing is a single index lookup.
+    """
+    frame_indices = []
+    frame_delays = []
+    frame_delay_indices = []
+
+    # Each entry is filled with C-level extends instead of per-tick appends
+    for frame_index, frame_delay in playback:
+        frame_indices.extend(repeat(frame_index, frame_delay))
+        frame_delays.extend(repeat(frame_delay, frame_delay))
+        frame_delay_indices.extend(range(1, frame_delay + 1))
+
+    return frame_indices, frame_delays, frame_delay_indices
+
+
 class TomoAnimation():
+    __slots__ = (
+        # Output frames
+        'frame', '_frame_prior', 'last_scale',
+        # Animation details and configuration
+        'animation_name', 'animation_path', '_resolved_name',
+        'idle_frames', 'transition_frames',
+        'idle_playback', 'transition_playback',
+        'default_repeats', 'default_skips', 'skip_transition',
+        # Info tracking
+        'animation_info_dict', '_info',
+        # Playback state
+        '_transition_schedule', '_idle_schedule', '_cursor',
+        '_in_transition', '_generation', '_hold_remaining',
+        '_frame_delay_index',
+        # Scaling caches
+        '_scale_cache', '_scale_cache_size', '_scaled_size', '_scaled_smooth',
+        '_transition_frames_scaled', '_idle_frames_scaled', '_scaled_current',
+    )
+
     def __init__(self,
                  animation_dict,
                  name="",
@@ -49,15 +199,16 @@ class TomoAnimation():
                  skip_transition=False,
                  animation_info_dict=None):
         # Init output frame variables
-        self.frame = pygame.Surface((0, 0))  # Current output frame
-        self._frame_prior = pygame.Surface((0, 0))  # Pre-processed frame
+        self.frame = _empty_surface()  # Current output frame
+        self._frame_prior = self.frame  # Pre-processed frame
 
         # Init animation detail vars
         self.animation_name = name
+        self._resolved_name = name or "ERROR"  # Name reported in info
         self.animation_path = animation_dict['animation_path']
 
-        self.idle_frames = animation_dict['idle']['frames']
-        self.transition_frames = animation_dict['transition']['frames']
+        self.idle_frames = animation_dict['idle']['frames'] or []
+        self.transition_frames = animation_dict['transition']['frames'] or []
 
         self.idle_playback = animation_dict['idle']['playback']
         self.transition_playback = animation_dict['transition']['playback']
@@ -67,89 +218,249 @@ class TomoAnimation():
         self.default_skips = default_skips
         self.skip_transition = skip_transition
 
-        # Init info tracking var
+        # Init info tracking vars
         self.animation_info_dict = animation_info_dict
+        self._info = _info_sink(animation_info_dict)
 
-        # Generate animation sequence iterator and running tracking vars
-        self.sequence = self._sequence()
+        # Generate flat playback schedules and running tracking vars
+        self._build_schedules()
+        self._cursor = -1
+        self._in_transition = not skip_transition
+        self._generation = 0
+
+        # Repeats left for the current frame, and how many have played
+        self._hold_remaining = 0
+        self._frame_delay_index = 0
         self.last_scale = None
 
+        # Init scaled frame cache, keyed by (frame id, size, smooth)
+        self._scale_cache = OrderedDict()
+        self._scale_cache_size = 2 * max(len(self.idle_frames),
+                                         len(self.transition_frames), 1)
+
+        # Init prescaled frame lists (see prescale())
+        self._scaled_size = None
+        self._scaled_smooth = True
+        self._transition_frames_scaled = self.transition_frames
+        self._idle_frames_scaled = self.idle_frames
+        self._scaled_current = None
+
     def __next__(self):
         return self.advance()
 
     def __iter__(self):
-        return self.sequence
+        return self
 
     def update(self, animation_dict, default_repeats=None, default_skips=None,
                skip_transition=None, animation_info_dict=None,
                reset=False):
         """Update animation attributes."""
-        self.name = animation_dict['animation_path']
-        self.idle_frames = animation_dict['idle']['frames']
-        self.transition_frames = animation_dict['transition']['frames']
+        self.animation_path = animation_dict['animation_path']
+        self.idle_frames = animation_dict['idle']['frames'] or []
+        self.transition_frames = animation_dict['transition']['frames'] or []
 
         self.idle_playback = animation_dict['idle']['playback']
         self.transition_playback = animation_dict['transition']['playback']
 
-        if default_skips:
+        if default_skips is not None:
             self.default_skips = default_skips
-        if default_repeats:
+        if default_repeats is not None:
             self.default_repeats = default_repeats
-        if skip_transition:
+        if skip_transition is not None:
             self.skip_transition = skip_transition
-        if animation_info_dict:
+        if animation_info_dict is not None:
             self.animation_info_dict = animation_info_dict
+            self._info = _info_sink(animation_info_dict)
+
+        self._resolved_name = self.animation_name or "ERROR"
+
+        self._build_schedules()
+        self._generation += 1
+        self._hold_remaining = 0
+
+        # Cached scaled frames may belong to the replaced frame lists
+        self._scale_cache.clear()
+        self._scale_cache_size = 2 * max(len(self.idle_frames),
+                                         len(self.transition_frames), 1)
+
+        # Prescaled frames are stale too, so prescale() must be called again
+        self._scaled_size = None
+        self._transition_frames_scaled = self.transition_frames
+        self._idle_frames_scaled = self.idle_frames
 
         if reset:
-            self.reset_animation()
+            self.reset()
 
     def reset(self, skip_transition=None):
         """Reset animation sequence, and play from start."""
-        if skip_transition:
+        if skip_transition is not None:
             self.skip_transition = skip_transition
 
-        self.sequence = self._sequence()
+        self._cursor = -1
+        self._in_transition = not self.skip_transition
+        self._hold_remaining = 0
 
     def advance(self, skip=None,
                 rescale_tuple=None, inplace=False, smooth=True):
         """Advance animation sequence, with optional scaling."""
-        if not skip:
+        if skip is None:
             skip = self.default_skips
 
-        for skips in range(skip):
-            self._frame_prior = next(self.sequence)
+        self._cursor += skip
+
+        # Keep holding the current frame while it has repeats left over,
+        # only looking up the schedule when the frame actually changes
+        if skip <= self._hold_remaining:
+            self._hold_remaining -= skip
+            self._frame_delay_index += skip
+
+            self._info.frame_delay_index = self._frame_delay_index
+
+            self.frame = self._frame_prior
+            self.last_scale = None
+
+            if rescale_tuple:
+                return self._get_frame_scaled(rescale_tuple, inplace, smooth)
+            return self.frame
+
+        # Walk off the end of the transition into the idle loop
+        if self._in_transition:
+            schedule = self._transition_schedule
+            frames = self.transition_frames
+            scaled_frames = self._transition_frames_scaled
+            state = 0
+
+            if self._cursor >= len(schedule[0]):
+                self._in_transition = False
+                self._cursor -= len(schedule[0])
+
+        if not self._in_transition:
+            schedule = self._idle_schedule
+            frames = self.idle_frames
+            scaled_frames = self._idle_frames_scaled
+            state = 1
+
+            # With no idle frames to loop, hold on the last frame shown
+            if not schedule[0]:
+                if rescale_tuple:
+                    return self._get_frame_scaled(rescale_tuple,
+                                                  inplace,
+                                                  smooth)
+                return self.frame
+
+            self._cursor %= len(schedule[0])
+
+        frame_indices, frame_delays, frame_delay_indices = schedule
+        frame_index = frame_indices[self._cursor]
+
+        self._frame_prior = frames[frame_index]
+        self._scaled_current = scaled_frames[frame_index]
+
+        info = self._info
+        info.animation_name = self._resolved_name
+        info.state = state
+        info.frame_delay = frame_delays[self._cursor]
+        info.frame = frame_index + 1
+        info.frame_delay_index = frame_delay_indices[self._cursor]
+
+        self._frame_delay_index = frame_delay_indices[self._cursor]
+        self._hold_remaining = (frame_delays[self._cursor]
+                                - self._frame_delay_index)
 
         self.frame = self._frame_prior
-        self.last_scale = rescale_tuple
+        self.last_scale = None
+
+        if rescale_tuple:
+            return self._get_frame_scaled(rescale_tuple, inplace, smooth)
+        return self.frame
+
+    def prescale(self, rescale_tuple, smooth=True):
+        """
+        Scale every frame to a target size ahead of time.
+
+        Call this whenever the display is resized. Frames fetched at the
+        prescaled size afterwards need no scaling work at all.
+        """
+        if rescale_tuple == self._scaled_size and smooth == self._scaled_smooth:
+            return
+
+        if smooth:
+            scale = pygame.transform.smoothscale
+        else:
+            scale = pygame.transform.scale
+
+        # Scale each distinct surface once across both frame lists, reusing
+        # any copy already in the scaled frame cache
+        scale_cache = self._scale_cache
+        scaled = {}
+
+        def scale_once(frame):
+            key = id(frame)
+            output = scaled.get(key)
+
+            if output is None:
+                entry = scale_cache.get((key, rescale_tuple, smooth))
+                if entry is not None and entry[0] is frame:
+                    output = entry[1]
+                else:
+                    output = scale(frame, rescale_tuple)
+                scaled[key] = output
 
-        return self.get_frame(rescale_tuple,
-                              inplace=inplace,
-                              smooth=smooth)
+            return output
+
+        self._transition_frames_scaled = [scale_once(frame)
+                                          for frame in self.transition_frames]
+        self._idle_frames_scaled = [scale_once(frame)
+                                    for frame in self.idle_frames]
+
+        self._scaled_size = rescale_tuple
+        self._scaled_smooth = smooth
+        self._scaled_current = None
 
     def scale_frame(self, frame, rescale_tuple, smooth=True):
-        """Scale a frame."""
+        """Scale a frame, reusing recently scaled copies of it."""
+        key = (id(frame), rescale_tuple, smooth)
+
+        # Entries keep their source frame, since ids are reused once an
+        # object is freed (e.g. a temporary surface passed in by a caller)
+        entry = self._scale_cache.get(key)
+        if entry is not None and entry[0] is frame:
+            self._scale_cache.move_to_end(key)
+            return entry[1]
+
         if smooth:
-            return pygame.transform.smoothscale(self._frame_prior,
-                                                rescale_tuple)
+            output = pygame.transform.smoothscale(frame, rescale_tuple)
         else:
-            return pygame.transform.scale(self._frame_prior,
-                                          rescale_tuple)
+            output = pygame.transform.scale(frame, rescale_tuple)
+
+        # Evict least recently used scaled frames
+        self._scale_cache[key] = (frame, output)
+        self._scale_cache.move_to_end(key)
+        if len(self._scale_cache) > self._scale_cache_size:
+            self._scale_cache.popitem(last=False)
+
+        return output
 
     def get_frame(self, rescale_tuple=None, inplace=False, smooth=True):
         """Get current frame, with optional scaling."""
         if rescale_tuple:
-            if self.last_scale == rescale_tuple:
-                return self.frame
-
+            return self._get_frame_scaled(rescale_tuple, inplace, smooth)
+        return self.frame
+
+    def _get_frame_scaled(self, rescale_tuple, inplace, smooth):
+        """Get current frame scaled to rescale_tuple."""
+        if (rescale_tuple == self._scaled_size
+                and smooth == self._scaled_smooth
+                and self._scaled_current is not None):
+            output = self._scaled_current
+        else:
             output = self.scale_frame(self._frame_prior, rescale_tuple, smooth)
 
-            if inplace:
-                self.last_scale = rescale_tuple
-                self.frame = output
+        if inplace:
+            self.last_scale = rescale_tuple
+            self.frame = output
 
-            return output
-        else:
-            return self.frame
+        return output
 
     # Getters
     def get_name(self):
@@ -164,92 +475,91 @@ class TomoAnimation():
     def get_frame_width(self):
         return self.frame.get_width()
 
+    def _build_schedules(self):
+        """Flatten playback lists into per-tick frame schedules."""
+        self._transition_schedule = _expand_playback(
+            self._playback(self.transition_playback,
+                           self.transition_frames,
+                           "Transition")
+        )
+        self._idle_schedule = _expand_playback(
+            self._playback(self.idle_playback, self.idle_frames, "Idle")
+        )
+
+    def _playback(self, playback, frames, sub_name):
+        """
+        Get a validated playback list, or the default one if none was passed.
+
+        Entries pointing at frames that do not exist are logged and dropped
+        here, so playback never has to check frame indices.
+
+        The default plays every frame in order, default_repeats times each.
+        It is produced lazily, so no list of tuples is built for it.
+        """
+        if len(playback) == 0:
+            return zip(range(len(frames)), repeat(self.default_repeats))
+
+        valid_playback = []
+
+        for frame_index, frame_delay in playback:
+            if 0 <= frame_index < len(frames):
+                valid_playback.append((frame_index, frame_delay))
+            else:
+                logger.error("%s frame %d for %s does not exist!",
+                             sub_name, frame_index, self.animation_name)
+
+        return valid_playback
+
     def _sequence(self):
-        """Dynamically generated custom animation iterable sequence."""
-        # If no playback list is passed, generate one
-        if len(self.transition_playback) == 0:
-            self.transition_playback = [
-                (x, self.default_repeats)
-                for x in range(len(self.transition_frames))
-            ]
-
-        if len(self.idle_playback) == 0:
-            self.idle_playback = [
-                (x, self.default_repeats) for x in range(len(self.idle_frames))
-            ]
+        """
+        Dynamically generated custom animation iterable sequence.
 
+        Legacy generator form of the playback schedule. :meth:`advance` reads
+        the flattened schedules directly instead.
+        """
         # Play transition
         if not self.skip_transition:
-            for frame_index, frame_delay in self.transition_playback:
-                try:
-                    if self.animation_info_dict:
-                        try:
-                            self.animation_info_dict['animation_name'] \
-                                = self.animation_name
-                        except Exception:
-                            self.animation_info_dict['animation_name'] \
-                                = "ERROR"
-
-                        self.animation_info_dict.update(
-                            {
-                                'state': 0,
-                                'frame_delay': frame_delay,
-                                'frame': frame_index + 1
-                             }
-                        )
-
-                    for i in range(frame_delay):
-                        if self.animation_info_dict:
-                            self.animation_info_dict['frame_delay_index'] \
-                                = i + 1
-
-                        yield self.transition_frames[frame_index]
-
-                except Exception as e:
-                    if self.animation_info_dict:
-                        self.animation_info_dict['frame_delay_index'] = -1
-
-                    logger.error(
-                        "%s | Transition frame %d for %s does not exist!"
-                        % (e, frame_index, self.animation_name)
-                    )
-
-                    yield None
-
-        # Play idle on loop
+            info = self._info
+            frames = self.transition_frames
+            name = self._resolved_name
+
+            for frame_index, frame_delay in self._playback(
+                    self.transition_playback, frames, "Transition"):
+                frame = frames[frame_index]
+
+                info.animation_name = name
+                info.state = 0
+                info.frame_delay = frame_delay
+                info.frame = frame_index + 1
+
+                for i in range(frame_delay):
+                    info.frame_delay_index = i + 1
+
+                    yield frame
+
+        # Play idle on loop, picking up changes from update() once per loop
+        generation = None
+
         while True:
-            for frame_index, frame_delay in self.idle_playback:
-                try:
-                    if self.animation_info_dict:
-                        try:
-                            self.animation_info_dict['animation_name'] \
-                                = self.animation_name
-                        except Exception:
-                            self.animation_info_dict['animation_name'] \
-                                = "ERROR"
-
-                        self.animation_info_dict.update(
-                            {
-                                'state': 0,
-                                'frame_delay': frame_delay,
-                                'frame': frame_index + 1
-                             }
-                        )
-
-                    for i in range(frame_delay):
-                        if self.animation_info_dict:
-                            self.animation_info_dict['frame_delay_index'] \
-                                = i + 1
-
-                        yield self.idle_frames[frame_index]
-
-                except Exception as e:
-                    if self.animation_info_dict:
-                        self.animation_info_dict['frame_delay_index'] = -1
-
-                    logger.error(
-                        "%s | Idle frame %d for %s does not exist!"
-                        % (e, frame_index, self.animation_name)
-                    )
-
-                    yield None
+            if generation != self._generation:
+                generation = self._generation
+
+                info = self._info
+                frames = self.idle_frames
+                name = self._resolved_name
+                playback = list(self._playback(self.idle_playback,
+                                               frames,
+                                               "Idle"))
+
+            for frame_index, frame_delay in playback:
+                frame = frames[frame_index]
+
+                info.animation_name = name
+                info.state = 1
+                info.frame_delay = frame_delay
+                info.frame = frame_index + 1
+
+                for i in range(frame_delay):
+                    info.frame_delay_index = i + 1
+
+                    yield frame
@@ -31,7 +31,10 @@ Features:
 """
 
 from TomoAnimation import TomoAnimation
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+import hashlib
 import logging
 import pygame
 import os
@@ -40,6 +43,66 @@ import os
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Shared worker pool for image decodes (pygame releases the GIL while decoding)
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Sub-animation folder names in play order, at least one of which an
+# animation needs
+_SUB_ANIMATIONS = ("transition", "idle")
+
+# Valid image file extensions
+_IMG_EXTS = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
+
+# Colour key used for frames with only fully transparent or opaque pixels
+_COLORKEY = (255, 0, 255)
+
+
+def _decode(path):
+    """Decode an image, returning (surface, digest of its size and pixels)."""
+    surface = pygame.image.load(path)
+
+    digest = hashlib.blake2b(repr(surface.get_size()).encode(),
+                             digest_size=16)
+    digest.update(pygame.image.tostring(surface, "RGBA"))
+
+    return surface, digest.digest()
+
+
+def _new_animation_dict(animation_path="", lazy=False):
+    """Make an empty animation dict, with None frames if lazily loaded."""
+    return {'transition': {'frames': None if lazy else [],
+                           'playback': []},
+            'idle': {'frames': None if lazy else [],
+                     'playback': []},
+            'animation_path': animation_path}
+
+
+def _frame_paths(paths):
+    """Get the frame paths of every sub-animation in an animation path dict."""
+    return [path for sub_animation in _SUB_ANIMATIONS
+            for path in paths[sub_animation]['frames']]
+
+
+def _surface_format(surface):
+    """Get a hashable (bitsize, alpha flag, masks) pixel format of a surface."""
+    return (surface.get_bitsize(), surface.get_flags() & pygame.SRCALPHA,
+            surface.get_masks())
+
+
+def _new_surface(size, like):
+    """Make a surface with exactly the same pixel format as another."""
+    # Passing the surface as depth with SRCALPHA would reorder its channels
+    return pygame.Surface(size, like.get_flags() & pygame.SRCALPHA,
+                          like.get_bitsize(), like.get_masks())
+
+
+def _scale_into(image, output):
+    """Smoothly scale an image into an output surface, returning it."""
+    # smoothscale area-averages when shrinking, so it needs no pre-pass
+    pygame.transform.smoothscale(image, output.get_size(), output)
+
+    return output
+
 
 class TomoAnimationLib():
     """
@@ -51,6 +114,10 @@ class TomoAnimationLib():
             Defaults to "".
         display (pygame.Display, optional): Pygame Display object to target
             animations towards. Defaults to None.
+        max_loaded (int, optional): Maximum number of animations to keep
+            loaded. Defaults to None. Leave as default for no limit.
+        max_pool_bytes (int, optional): Maximum size of pooled scratch
+            surfaces used while scaling, in bytes. Defaults to 32 MiB.
 
     Attributes:
         animation_frame_lib (dict): Loaded animation frames and playback lists.
@@ -59,6 +126,11 @@ class TomoAnimationLib():
         animation_path (str): Path to overall animation directory.
         display (pygame.Display or None): Pygame Display object to target
             animations towards.
+        max_loaded (int or None): Maximum number of animations to keep
+            loaded. Least recently used animations are unloaded first, but
+            the most recently used one is always kept.
+        max_pool_bytes (int): Maximum size of pooled scratch surfaces used
+            while scaling, in bytes.
 
     Note:
         Animations consist of transition and idle frames.
@@ -67,16 +139,43 @@ class TomoAnimationLib():
         will loop.
     """
 
-    def __init__(self, animation_path="", display=None):
+    def __init__(self, animation_path="", display=None, max_loaded=None,
+                 max_pool_bytes=32 * 1024 * 1024):
         """
         Args:
             animation_path (str, optional): Path to overall animation
                 directory. Defaults to "".
             display (pygame.Display, optional): Pygame Display object to target
                 animations towards. Defaults to None.
+            max_loaded (int, optional): Maximum number of animations to keep
+                loaded. Defaults to None. Leave as default for no limit.
+            max_pool_bytes (int, optional): Maximum size of pooled scratch
+                surfaces used while scaling, in bytes. Defaults to 32 MiB.
         """
         self.animation_frame_lib = {}
         self.animation_path_lib = {}
+        self.max_loaded = max_loaded
+        self.max_pool_bytes = max_pool_bytes
+
+        # Scratch surfaces reused across scaling, keyed by geometry
+        self._surface_pool = OrderedDict()
+        self._pool_bytes = 0
+
+        # Decoded source images, keyed by absolute path
+        self._decode_cache = {}
+
+        # Scaled images, keyed by (pixel digest, rescale_tuple, stretch), so
+        # frames with identical pixels share one surface
+        self._scaled_cache = {}
+
+        # Parsed playback files, keyed by path as (mtime, playback list)
+        self._playback_cache = {}
+
+        # Scaling each loaded animation was loaded with
+        self._load_params = {}
+
+        # Pixel format of the display frames were last converted for
+        self._display_fp = None
 
         self.display = None
         self.animation_path = animation_path
@@ -104,8 +203,23 @@ class TomoAnimationLib():
         Source:
             http://www.pygame.org/pcr/transform_scale/
         """
+        return self._aspect_size(img.get_size(), rescale_tuple)
+
+    def _aspect_size(self, size, rescale_tuple):
+        """
+        Get scaled dimensions for an image size while retaining aspect ratio.
+
+        Args:
+            size ((int, int)): Image dimensions as a tuple of (width, height).
+            rescale_tuple ((int, int)): Target scale dimensions
+                as a tuple of (width, height).
+
+        Returns:
+            (int, int): Tuple of (scaled_width, scaled_height) that preserves
+            aspect ratio.
+        """
         bx, by = rescale_tuple
-        ix, iy = img.get_size()
+        ix, iy = size
 
         if ix > iy:
             scale_factor = bx / float(ix)
@@ -142,21 +256,309 @@ class TomoAnimationLib():
 
         Returns:
             pygame.Surface: The loaded image, scaled if requested.
+
+        ‏‎Note:
+            Scaled or converted images are cached and shared between calls,
+            and between frames with identical pixels, so they must not be
+            modified.
+        """
+        # Slots are filled in place, as scaled frames finish out of order
+        output = [None] * len(img_path_list)
+        processed = rescale_tuple or self.display
+        size_key = tuple(rescale_tuple) if rescale_tuple else None
+
+        # Frames usually share a source size, so compute each target once
+        target_sizes = {}
+
+        # Frames to scale, as (output index, cache key, source, output surface)
+        jobs = []
+
+        # Output index of each key first seen in this call, so frames with
+        # identical pixels are only scaled once
+        pending = {}
+        duplicates = []
+
+        stats = self._prefetch_decodes(img_path_list)
+
+        for index, path in enumerate(img_path_list):
+            abs_path = stats[path][0]
+
+            _, image, digest = self._decode_cache[abs_path]
+            key = None
+
+            # Reuse an earlier result for the same pixels and scaling
+            if processed:
+                key = (digest, size_key, stretch)
+
+                cached = self._scaled_cache.get(key)
+                if cached is not None:
+                    output[index] = cached
+                    continue
+
+                if key in pending:
+                    duplicates.append((index, pending[key]))
+                    continue
+
+                pending[key] = index
+
+            if rescale_tuple:
+                if stretch:  # Stretch images to fit display
+                    size = tuple(rescale_tuple)
+                else:  # Otherwise, preserve aspect ratio
+                    source_size = image.get_size()
+                    size = target_sizes.get(source_size)
+                    if size is None:
+                        size = self._aspect_size(source_size, rescale_tuple)
+                        target_sizes[source_size] = size
+
+                # Images already at the target size need no resampling
+                if image.get_size() != size:
+                    # Scale into a pooled surface if it will be converted
+                    if self.display:
+                        surface = self._pool_get(size, image)
+                    else:
+                        surface = _new_surface(size, image)
+
+                    jobs.append((index, key, image, surface))
+                    continue
+
+            output[index] = self._finish_image(image, key, scaled=False)
+
+        # Scaling releases the GIL, so batches are scaled in parallel
+        if len(jobs) > 1:
+            scaled_images = list(_POOL.map(_scale_into,
+                                           [job[2] for job in jobs],
+                                           [job[3] for job in jobs]))
+        else:
+            scaled_images = [_scale_into(job[2], job[3]) for job in jobs]
+
+        for (index, key, _, _), image in zip(jobs, scaled_images):
+            output[index] = self._finish_image(image, key, scaled=True)
+
+        for index, first in duplicates:
+            output[index] = output[first]
+
+        return output
+
+    def _finish_image(self, image, key, scaled):
+        """
+        Convert a loaded image for the display and cache it.
+
+        Args:
+            image (pygame.Surface): Decoded or scaled image.
+            key (tuple or None): Scaled image cache key. Leave as None to not
+                cache the image.
+            scaled (bool): Whether the image is a scaled result (pooled if a
+                display is set) rather than a shared decode.
+
+        Returns:
+            pygame.Surface: The finished image.
+        """
+        # Match the display's pixel format so blits take the fast path
+        if self.display:
+            converted = self._convert_image(image)
+
+            if scaled:
+                self._pool_put(image)
+
+            image = converted
+        elif not scaled:
+            # Scaling and converting both copy, so only copy plain decodes
+            image = image.copy()
+
+        if key is not None:
+            self._scaled_cache[key] = image
+
+        return image
+
+    def _pool_get(self, size, like):
+        """
+        Take a scratch surface from the surface pool, or make a new one.
+
+        Args:
+            size ((int, int)): Dimensions of the surface.
+            like (pygame.Surface): Surface whose pixel format to match.
+
+        Returns:
+            pygame.Surface: A surface of the requested size and format.
+        """
+        key = (size,) + _surface_format(like)
+        surfaces = self._surface_pool.get(key)
+
+        if surfaces:
+            surface = surfaces.pop()
+            self._pool_bytes -= surface.get_pitch() * surface.get_height()
+
+            if not surfaces:
+                del self._surface_pool[key]
+
+            return surface
+
+        return _new_surface(size, like)
+
+    def _pool_put(self, surface):
+        """
+        Return a scratch surface to the surface pool.
+
+        Args:
+            surface (pygame.Surface): Surface to return. It must not be
+                referenced anywhere else.
+
+        Note:
+            Least recently returned geometries are dropped first once the
+            pool exceeds max_pool_bytes.
+        """
+        key = (surface.get_size(),) + _surface_format(surface)
+
+        self._surface_pool.setdefault(key, []).append(surface)
+        self._surface_pool.move_to_end(key)
+        self._pool_bytes += surface.get_pitch() * surface.get_height()
+
+        # Stop once the pool is empty, even for a budget of 0 or less
+        while self._surface_pool and self._pool_bytes > self.max_pool_bytes:
+            key, surfaces = next(iter(self._surface_pool.items()))
+            evicted = surfaces.pop(0)
+            self._pool_bytes -= evicted.get_pitch() * evicted.get_height()
+
+            if not surfaces:
+                del self._surface_pool[key]
+
+    def _convert_image(self, image):
+        """
+        Convert an image to the cheapest display pixel format that fits it.
+
+        Args:
+            image (pygame.Surface): Image to convert.
+
+        Returns:
+            pygame.Surface: The converted image.
+
+        Note:
+            Opaque images are converted without alpha, and images whose
+            pixels are only fully opaque or fully transparent are colour
+            keyed. Anything else keeps per-pixel alpha.
+        """
+        if image.get_flags() & pygame.SRCALPHA:
+            width, height = image.get_size()
+            opaque = pygame.mask.from_surface(image, 254)
+
+            if opaque.count() != width * height:
+                visible = pygame.mask.from_surface(image, 0)
+                clashes = pygame.mask.from_threshold(
+                    image, _COLORKEY + (255,), (1, 1, 1, 1)
+                )
+
+                # Partial transparency needs per-pixel alpha, as does an
+                # image that already uses the colour key
+                if visible.count() != opaque.count() or clashes.count():
+                    return image.convert_alpha(self.display)
+
+                output = image.convert(self.display)
+                visible.invert()
+                visible.to_surface(output, setcolor=_COLORKEY,
+                                   unsetcolor=None)
+                output.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+
+                return output
+
+        return image.convert(self.display)
+
+    def _prefetch_decodes(self, img_path_list):
+        """
+        Decode uncached or changed images in parallel into the decode cache.
+
+        Args:
+            img_path_list (iterable of str): Paths to images to decode.
+
+        Returns:
+            dict: Maps each given path to its (absolute_path, mtime).
+
+        Note:
+            Each unique path is stat-ed once. Decodes are cached against the
+            file's modification time, along with a digest of their pixels,
+            and are evicted when their animation is unloaded or removed.
+
+            Conversion stays on the calling thread.
+        """
+        stats = {}
+        pending = {}
+
+        self._submit_decodes(img_path_list, stats, pending)
+        self._collect_decodes(pending)
+
+        return stats
+
+    def _submit_decodes(self, img_path_list, stats, pending):
+        """
+        Queue decodes of uncached or changed images without waiting for them.
+
+        Args:
+            img_path_list (iterable of str): Paths to images to decode.
+            stats (dict): Maps paths to their (absolute_path, mtime). Paths
+                already in it are skipped, and new ones are added.
+            pending (dict): Maps absolute paths to their (mtime, future) for
+                queued decodes. New decodes are added.
+        """
+        for path in img_path_list:
+            if path in stats:
+                continue
+
+            abs_path = os.path.abspath(path)
+            mtime = os.path.getmtime(abs_path)
+            stats[path] = (abs_path, mtime)
+
+            cached = self._decode_cache.get(abs_path)
+            if (cached is None or cached[0] != mtime) \
+                    and abs_path not in pending:
+                pending[abs_path] = (mtime, _POOL.submit(_decode, abs_path))
+
+    def _collect_decodes(self, pending):
+        """
+        Wait for queued decodes and store them in the decode cache.
+
+        Args:
+            pending (dict): Maps absolute paths to their (mtime, future), as
+                filled by :meth:`~TomoAnimationLib._submit_decodes()`.
+        """
+        for abs_path, (mtime, future) in pending.items():
+            self._decode_cache[abs_path] = (mtime,) + future.result()
+
+    def _prewarm(self):
+        """
+        Decode the frames of every animation in the path lib in one batch.
+
+        ‏‎Note:
+            Frames shared between animations are only decoded once, and
+            loading animations afterwards needs no further decoding.
         """
-        if rescale_tuple:
-            if stretch:  # Stretch images to fit display
-                return [pygame.transform.smoothscale(pygame.image.load(image),
-                                                     rescale_tuple)
-                        for image in img_path_list]
+        self._prefetch_decodes(
+            {os.path.abspath(path)
+             for paths in self.animation_path_lib.values()
+             for path in _frame_paths(paths)}
+        )
+
+    def _evict_decodes(self, name):
+        """
+        Drop cached image decodes and scaled images for an animation in the
+        path lib.
+
+        Args:
+            name (str): Animation name.
+        """
+        paths = self.animation_path_lib.get(name)
+        if not paths:
+            return
+
+        abs_paths = {os.path.abspath(path) for path in _frame_paths(paths)}
 
-            else:  # Otherwise, preserve aspect ratio
-                return [pygame.transform.smoothscale(pygame.image.load(image),
-                        self.aspect_scale(pygame.image.load(image),
-                                          rescale_tuple))
-                        for image in img_path_list]
+        digests = set()
+        for abs_path in abs_paths:
+            cached = self._decode_cache.pop(abs_path, None)
+            if cached is not None:
+                digests.add(cached[2])
 
-        else:  # If no rescale_tuple is provided, just load images naively
-            return [pygame.image.load(image) for image in img_path_list]
+        for key in [key for key in self._scaled_cache if key[0] in digests]:
+            del self._scaled_cache[key]
 
     def set_display(self, display, skip_unload=False):
         """
@@ -166,37 +568,33 @@ class TomoAnimationLib():
             display (pygame.Surface): Target display to optimise towards.
             skip_unload (bool, optional): If True, does not unload animations
                 after setting display. Defaults to False.
+
+        ‏‎Note:
+            Animations are only unloaded if the display's pixel format
+            changed, since frames converted for an identical format can be
+            kept as they are. Decoded source images are kept either way, so
+            reloading only rescales and converts.
         """
         assert type(display) == pygame.Surface, \
             "Display must be of type pygame.Surface!"
 
         self.display = display
 
-        if not skip_unload:
-            self.unload_animations()
+        display_fp = (display.get_bitsize(), display.get_masks())
+        if display_fp == self._display_fp:
+            return
 
-    def _optimise_animation(self, name):
-        """
-        Optimise image format for an animation's images.
+        self._display_fp = display_fp
 
-        Args:
-            name (str): The name of the animation that will be optimised.
-        """
-        if self.display:
-            try:
-                frame_lib = self.animation_frame_lib[name]
-                # Convert animation library to appropriate pixel format
-                for image in frame_lib['transition']['frames']:
-                    image = image.convert_alpha(self.display)
-
-                for image in frame_lib['idle']['frames']:
-                    image = image.convert_alpha(self.display)
-            except Exception as e:
-                logger.error("%s", e)
-        else:
-            logger.warning("No target display specified to optimise for!")
+        # Cached images were converted for the previous display format
+        self._scaled_cache.clear()
 
-    def _load_animation(self, name, rescale_tuple=None, stretch=False):
+        # Decoded sources are display independent, so reloads skip decoding
+        if not skip_unload:
+            self._release_surfaces(keep_decodes=True)
+
+    def _load_animation(self, name, rescale_tuple=None, stretch=False,
+                        sub_animations=None):
         """
         Load an animation in the path lib into the frame lib.
 
@@ -207,49 +605,134 @@ class TomoAnimationLib():
             stretch (bool, optional): If True, scales images while disregarding
                 aspect ratio. Otherwise, preserves aspect ratio when scaling.
                 Defaults to False.
-
-        See also:
-            :meth:`~TomoAnimationLib._optimise_animation()`
+            sub_animations (iterable of str, optional): Sub-animations to load.
+                Defaults to None. Leave as default to load both. Others are
+                left unloaded, with their frames set to None.
 
         ‏‎Note:
             Private wrapper of the `load_animation()` method that also
             generates playback lists.
 
-            Also causes loaded animations to be automatically optimised.
+            Also causes loaded animations to be automatically optimised, as
+            :meth:`~TomoAnimationLib.load_images()` converts frames to the
+            display's pixel format.
         """
         paths = self.animation_path_lib[name]
 
-        # Generate playback lists
-        if paths['transition']['playback']:
-            with open(paths['transition']['playback']) as f:
-                transition_playback = self._generate_playback_list(f.read())
-        else:  # If no path to playback file exists, create an empty list
-            transition_playback = []
+        if sub_animations is None:
+            sub_animations = _SUB_ANIMATIONS
+
+        # Populate frame lib, leaving unrequested sub-animations unloaded
+        self.animation_frame_lib.pop(name, None)
+        self.animation_frame_lib[name] = \
+            _new_animation_dict(paths['animation_path'], lazy=True)
+        self._load_params[name] = \
+            (tuple(rescale_tuple) if rescale_tuple else None, stretch)
+
+        # Decode every requested sub-animation's frames in one parallel batch
+        self._prefetch_decodes(
+            [path for sub_animation in sub_animations
+             for path in paths[sub_animation]['frames']]
+        )
+
+        for sub_animation in sub_animations:
+            self._load_sub_animation(name, sub_animation)
+
+        self._evict_animations()
+
+        if not self.display:
+            logger.warning("No target display specified to optimise for!")
 
-        if paths['idle']['playback']:
-            with open(paths['idle']['playback']) as f:
-                idle_playback = self._generate_playback_list(f.read())
+    def _load_sub_animation(self, name, sub_animation):
+        """
+        Load a single sub-animation of an animation already in the frame lib.
+
+        Args:
+            name (str): Name of the animation to load.
+            sub_animation (str): "transition" or "idle".
+
+        ‏‎Note:
+            Frames are scaled the same way as the rest of the animation.
+        """
+        paths = self.animation_path_lib[name][sub_animation]
+        rescale_tuple, stretch = self._load_params.get(name, (None, False))
+
+        # Generate playback list
+        playback = paths['playback']
+        if not isinstance(playback, str):
+            # Sub-animations added directly carry their playback list
+            playback = list(playback)
+        elif playback:
+            playback = self._load_playback(playback)
         else:  # If no path to playback file exists, create an empty list
-            idle_playback = []
+            playback = []
 
-        # Load images
-        transition_frames = self.load_images(paths['transition']['frames'],
-                                             rescale_tuple,
-                                             stretch)
+        self.animation_frame_lib[name][sub_animation] = \
+            {'frames': self.load_images(paths['frames'], rescale_tuple,
+                                        stretch),
+             'playback': playback}
 
-        idle_frames = self.load_images(paths['idle']['frames'],
-                                       rescale_tuple,
-                                       stretch)
+    def _load_playback(self, path):
+        """
+        Parse a playback file, reusing the last parse if it is unchanged.
 
-        # Populate frame lib
-        self.animation_frame_lib[name] = \
-            {'transition': {'frames': transition_frames,
-                            'playback': transition_playback},
-             'idle': {'frames': idle_frames,
-                      'playback': idle_playback},
-             'animation_path': paths['animation_path']}
+        Args:
+            path (str): Path to the playback file.
+
+        Returns:
+            list: The playback list.
+        """
+        mtime = os.path.getmtime(path)
+        cached = self._playback_cache.get(path)
+
+        if cached is None or cached[0] != mtime:
+            with open(path) as f:
+                cached = (mtime, self._generate_playback_list(f.read()))
+            self._playback_cache[path] = cached
+
+        return list(cached[1])
+
+    def _require_animation(self, name, skip_transition, rescale_tuple=None,
+                           stretch=False):
+        """
+        Make sure the sub-animations an animation will play are loaded.
+
+        Args:
+            name (str): Name of the animation.
+            skip_transition (bool): If True, the transition is not needed.
+            rescale_tuple ((int, int), optional): Dimensions to scale images
+                to. Defaults to None. Leave as default to reuse the loaded
+                scale.
+            stretch (bool, optional): If True, scales images while disregarding
+                aspect ratio. Otherwise, preserves aspect ratio when scaling.
+                Defaults to False.
+        """
+        sub_animations = ("idle",) if skip_transition else _SUB_ANIMATIONS
+
+        # If animation has not been initialised (from lazy initialisation)
+        # Or the animation needs to be scaled differently, reload it
+        if name not in self.animation_frame_lib \
+                or (rescale_tuple and self._load_params.get(name)
+                    != (tuple(rescale_tuple), stretch)):
+            self._load_animation(name, rescale_tuple, stretch, sub_animations)
+            return
+
+        for sub_animation in sub_animations:
+            if self.animation_frame_lib[name][sub_animation]['frames'] is None:
+                self._load_sub_animation(name, sub_animation)
+
+        # Mark as most recently used
+        self.animation_frame_lib[name] = self.animation_frame_lib.pop(name)
+
+    def _evict_animations(self):
+        """Unload least recently used animations beyond max_loaded."""
+        if self.max_loaded is None:
+            return
 
-        self._optimise_animation(name)
+        # Always keep the most recently used animation, so the animation that
+        # was just loaded is never unloaded before it is returned
+        while len(self.animation_frame_lib) > max(self.max_loaded, 1):
+            self.unload_animation(next(iter(self.animation_frame_lib)))
 
     ###########################################################################
     # Sanity Check Methods
@@ -261,27 +744,35 @@ class TomoAnimationLib():
 
         Returns:
             True if image file has a valid extension, False otherwise."""
-        try:
-            return any([filename.endswith(img_type)
-                        for img_type in [".jpg", ".png", ".gif"]])
-        except Exception:
-            return False
+        return isinstance(filename, str) and \
+            filename.lower().endswith(_IMG_EXTS)
 
-    def is_valid_animation(self, path):
+    def is_valid_animation(self, path, entries=None):
         """
         Check if a given path is a valid animation directory.
 
+        Args:
+            path (str): Path to check.
+            entries (set or dict of str, optional): Names in the directory, if
+                already listed. Defaults to None. Leave as default to list the
+                path.
+
         Returns:
             True if directory is valid, False otherwise.
         """
-        try:
-            if "idle" in os.listdir(path) or "transition" in os.listdir(path):
-                return True
-            else:
-                logger.warning("%s is not a valid animation folder!"
-                               " It needs an /idle or /transition folder!",
-                               path)
-        except Exception:
+        if entries is None:
+            try:
+                entries = os.listdir(path)
+            except OSError as e:
+                logger.warning("Could not read %s: %s", path, e)
+                return False
+
+        if any(sub_animation in entries for sub_animation in _SUB_ANIMATIONS):
+            return True
+        else:
+            logger.warning("%s is not a valid animation folder!"
+                           " It needs an /idle or /transition folder!",
+                           path)
             return False
 
     ###########################################################################
@@ -310,7 +801,7 @@ class TomoAnimationLib():
         ‏‎Note:
             This causes the animation path lib to be modified in-place!
         """
-        for name, paths in self._parse_animation_path(animation_path).items():
+        for name, paths in self._iter_animation_paths(animation_path):
             self.animation_path_lib[name] = paths
 
         return self.animation_path_lib
@@ -334,7 +825,20 @@ class TomoAnimationLib():
             This causes the animation path and frame libs to be modified
             in-place!
         """
-        self.add_animations(animation_path)
+        stats = {}
+        pending = {}
+
+        # Queue each animation's decodes as soon as it is found, so walking
+        # the rest of the directory overlaps decoding
+        for name, paths in self._iter_animation_paths(animation_path):
+            self.animation_path_lib[name] = paths
+            self._submit_decodes(_frame_paths(paths), stats, pending)
+
+        # Animations added earlier are decoded in the same batch
+        for paths in self.animation_path_lib.values():
+            self._submit_decodes(_frame_paths(paths), stats, pending)
+
+        self._collect_decodes(pending)
 
         for name in self.animation_path_lib.keys():
             self._load_animation(name, rescale_tuple, stretch)
@@ -360,27 +864,24 @@ class TomoAnimationLib():
         ‏‎Note:
             This causes the animation path lib to be modified in-place!
         """
-        assert sub_name in ["transition", "idle"], \
+        assert sub_name in _SUB_ANIMATIONS, \
             "sub_name must be \"idle\" or \"transition\"!"
 
-        assert all(self.is_image_file(path) for path in img_path_list), \
-            (
-                "Paths in the given path list are not valid image paths: %s" %
-                str([path for path in img_path_list
-                     if not self.is_image_file(path)])
-            )
+        is_image_file = self.is_image_file
+        invalid_path = next(
+            (path for path in img_path_list if not is_image_file(path)), None
+        )
+        assert invalid_path is None, \
+            "Path in the given path list is not a valid image path: %s" \
+            % str(invalid_path)
 
         # Add animation path dict if it doesn't exist
         if name not in self.animation_path_lib:
-            self.animation_path_lib[name] = {'transition': {'frames': [],
-                                                            'playback': []},
-                                             'idle': {'frames': [],
-                                                      'playback': []},
-                                             'animation_path': ""}
+            self.animation_path_lib[name] = _new_animation_dict()
 
         self.animation_path_lib[name][sub_name].update(
             {'frames': img_path_list,
-             'playack': playback_list}
+             'playback': playback_list}
         )
 
         return self.animation_path_lib
@@ -406,23 +907,22 @@ class TomoAnimationLib():
             This causes the animation path and frame libs to be modified
             in-place!
         """
-        assert sub_name in ["transition", "idle"], \
+        assert sub_name in _SUB_ANIMATIONS, \
             "sub_name must be \"idle\" or \"transition\"!"
 
-        self.add_single_animation(name, sub_name, img_path_list, playback_list)
+        self.add_single_subanimation(name, sub_name, img_path_list,
+                                     playback_list)
 
         # Add animation frame dict if it doesn't exist
         if name not in self.animation_frame_lib:
-            self.animation_frame_lib[name] = {'transition': {'frames': [],
-                                                             'playback': []},
-                                              'idle': {'frames': [],
-                                                       'playback': []},
-                                              'animation_path': ""}
+            self.animation_frame_lib[name] = _new_animation_dict()
 
         self.animation_frame_lib[name][sub_name].update(
             {'frames': self.load_images(img_path_list, rescale_tuple, stretch),
              'playback': playback_list}
         )
+        self._load_params[name] = \
+            (tuple(rescale_tuple) if rescale_tuple else None, stretch)
 
         return self.animation_path_lib, self.animation_frame_lib
 
@@ -438,49 +938,70 @@ class TomoAnimationLib():
         Returns:
             dict: The resulting animation path lib.
         """
-        # Create output paths dict
-        paths = {}
+        return dict(self._iter_animation_paths(path, playback_file))
+
+    def _iter_animation_paths(self, path, playback_file="frames"):
+        """
+        Parse valid animation paths in a directory one animation at a time.
+
+        Args:
+            path (str): Path to animation directory.
+            playback_file (str, optional): Name of playback file.
+                Defaults to "frames".
+
+        Yields:
+            (str, dict): Each animation's name and path dict, as they are
+            found.
+        """
+        # Normalise once so every path built from DirEntry.path is clean
+        path = os.path.normpath(path)
 
         # Iterate through all possible folder paths
-        for folder_path in os.listdir(path):
-            # Create path dict for single animation (from folders in path)
-            animation_path_dict = {'transition': {'frames': [],
-                                                  'playback': []},
-                                   'idle': {'frames': [],
-                                            'playback': []},
-                                   'animation_path': ""}
-            animation_path = path + "/" + folder_path
+        with os.scandir(path) as folders:
+            folders = [entry for entry in folders if entry.is_dir()]
+
+        for folder in folders:
+            animation_path = folder.path
+
+            try:
+                with os.scandir(animation_path) as sub_folders:
+                    sub_folders = {entry.name: entry for entry in sub_folders}
+            except OSError as e:
+                logger.warning("Could not read %s: %s", animation_path, e)
+                continue
 
             # And only proceed if that animation's path is valid
-            if self.is_valid_animation(animation_path):
-                for sub_animation in ["transition", "idle"]:
-                    try:
-                        sub_animation_path = (animation_path + "/"
-                                              + sub_animation + "/")
-                        filenames = os.listdir(sub_animation_path)
+            if not self.is_valid_animation(animation_path, sub_folders):
+                continue
 
-                        animation_path_dict['animation_path'] = animation_path
+            # Create path dict for single animation (from folders in path)
+            animation_path_dict = _new_animation_dict(animation_path)
 
-                        # Construct sorted list of paths to valid frames
-                        frames = [sub_animation_path + frame
-                                  for frame in filenames
-                                  if self.is_image_file(frame)]
-                        frames.sort()
-                        animation_path_dict[sub_animation]['frames'] = frames
+            for sub_animation in _SUB_ANIMATIONS:
+                if sub_animation not in sub_folders:
+                    animation_path_dict[sub_animation]['playback'] = ""
+                    continue
 
-                        # Add playback list path
-                        if playback_file in filenames:
-                            animation_path_dict[sub_animation]['playback'] \
-                                = sub_animation_path + "/" + playback_file
-                        else:
-                            animation_path_dict[sub_animation]['playback'] = ""
+                try:
+                    with os.scandir(sub_folders[sub_animation].path) as files:
+                        files = {entry.name: entry.path for entry in files}
 
-                    except Exception as e:
-                        logger.error("%s", e)
+                    # Construct sorted list of paths to valid frames
+                    frames = [file_path
+                              for filename, file_path in files.items()
+                              if self.is_image_file(filename)]
+                    frames.sort()
+                    animation_path_dict[sub_animation]['frames'] = frames
 
-                paths[folder_path] = animation_path_dict
+                    # Add playback list path
+                    animation_path_dict[sub_animation]['playback'] = \
+                        files.get(playback_file, "")
 
-        return paths
+                except OSError as e:
+                    logger.warning("Could not read %s: %s",
+                                   sub_folders[sub_animation].path, e)
+
+            yield folder.name, animation_path_dict
 
     def _generate_playback_list(self, data, delimiter=" ", default_repeats=1):
         """
@@ -495,7 +1016,7 @@ class TomoAnimationLib():
 
         Args:
             data (str): The string from the playback file.
-            delimited (str, optional): The delimiter to separate frame number
+            delimiter (str, optional): The delimiter to separate frame number
                 and number of repeats per line. Defaults to " ".
             default_repeats (int, optional): The number of times to repeat
                 playing a frame if no repeats were specified. Defaults to 1.
@@ -506,26 +1027,24 @@ class TomoAnimationLib():
         See Also:
             For information on playback lists, see: :doc:`Data Structures`
         """
-        if len(data) == 0:
-            return []
+        output = []
 
-            playback_list = data.strip().split("\n")
-            output = []
+        # Splitting on None also collapses runs of whitespace
+        separator = None if delimiter == " " else delimiter
 
-            for row, frame in enumerate(playback_list, 1):
-                split_frame = tuple(
-                    [int(x) for x in frame.strip().split(delimiter)]
-                )
+        for row, line in enumerate(data.splitlines(), 1):
+            split_frame = line.split(separator)
 
-                assert len(split_frame) <= 2, "Frame %d is of invalid form!" \
-                    % (row)
+            assert len(split_frame) <= 2, "Frame %d is of invalid form!" \
+                % (row)
 
-                if len(split_frame) == 1:
-                    output.append((split_frame[0], default_repeats))
-                    if len(split_frame) == 2:
-                        output.append(split_frame)
+            if len(split_frame) == 2:
+                output.append((int(split_frame[0]), int(split_frame[1])))
+            elif split_frame and split_frame[0].strip():
+                output.append((int(split_frame[0]), default_repeats))
+            # Otherwise skip blank lines
 
-                        return output
+        return output
 
     ###########################################################################
     # Animation Management Methods
@@ -562,8 +1081,10 @@ class TomoAnimationLib():
                 Otherwise, preserves aspect ratio when scaling.
                 Defaults to False.
         """
+        self._prewarm()
+
         for name in self.animation_path_lib:
-            self._load_animation(name, rescale_tuple=None, stretch=False)
+            self._load_animation(name, rescale_tuple, stretch)
 
     def unload_animation(self, name):
         """
@@ -572,14 +1093,14 @@ class TomoAnimationLib():
         Args:
             name (str): Animation name.
         """
-        try:
-            self.animation_frame_lib.pop(name)
-        except Exception:
-            pass
+        self._evict_decodes(name)
+        self._load_params.pop(name, None)
+
+        self.animation_frame_lib.pop(name, None)
 
     def unload_animations(self):
         """Unload animation frame images to clear memory."""
-        self.animation_frame_lib = {}
+        self._release_surfaces()
 
     def remove_animation(self, name):
         """
@@ -588,16 +1109,40 @@ class TomoAnimationLib():
         Args:
             name (str): Animation name.
         """
-        try:
-            self.animation_path_lib.pop(name)
-            self.animation_frame_lib.pop(name)
-        except Exception:
-            pass
+        self._evict_decodes(name)
+        self._load_params.pop(name, None)
+
+        self.animation_path_lib.pop(name, None)
+        self.animation_frame_lib.pop(name, None)
 
     def remove_animations(self):
         """Remove animations from the frame and path libraries."""
-        self.animation_frame_lib = {}
-        self.animation_path_lib = {}
+        self._release_surfaces()
+        self.animation_path_lib.clear()
+        self._playback_cache.clear()
+
+    def _release_surfaces(self, keep_decodes=False):
+        """
+        Drop all loaded frames, and all cached and pooled surfaces.
+
+        Args:
+            keep_decodes (bool, optional): If True, decoded source images are
+                kept, as they do not depend on the display. Defaults to False.
+
+        ‏‎Note:
+            The containers are cleared in place rather than rebound, so
+            surfaces are freed straight away even if something else still
+            holds a reference to them (e.g. to the frame lib).
+        """
+        self.animation_frame_lib.clear()
+        self._scaled_cache.clear()
+        self._load_params.clear()
+
+        self._surface_pool.clear()
+        self._pool_bytes = 0
+
+        if not keep_decodes:
+            self._decode_cache.clear()
 
     def create_animation(self, name, rescale_tuple=None, stretch=False,
                          default_repeats=1, default_skips=1,
@@ -621,18 +1166,21 @@ class TomoAnimationLib():
                 animation iterator on each advance call. Defaults to 1.
             skip_transition (bool, optional): If True, animation will skip
                 playing its transition. Defaults to False.
-            animation_info_dict (dict, optional): Pass in a `dict` object
-                to track animation info. Defaults to None.
+            animation_info_dict (dict or :class:`~TomoAnimation.AnimationInfo`,
+                optional): Pass in a `dict` or `AnimationInfo` object to track
+                animation info. Defaults to None.
 
         Returns:
             :class:`~TomoAnimation.TomoAnimation()`: The configured
                 :class:`~TomoAnimation.TomoAnimation()` object.
+
+        ‏‎Note:
+            Only the sub-animations that will be played are loaded, so the
+            transition is not loaded if it is skipped.
         """
         try:
-            # If animation has not been initialised (from lazy initialisation)
-            # Or the animation needs to be scaled, reload it
-            if name not in self.animation_frame_lib or rescale_tuple:
-                self._load_animation(name, rescale_tuple, stretch)
+            self._require_animation(name, skip_transition, rescale_tuple,
+                                    stretch)
 
             return TomoAnimation(self.animation_frame_lib[name],
                                  name,
@@ -646,8 +1194,8 @@ class TomoAnimationLib():
     def update_animation(self, animation,
                          rescale_tuple=None, stretch=False,
                          transition_playback=None, idle_playback=None,
-                         default_repeats=1, default_skips=1,
-                         skip_transition=False, animation_info_dict=None,
+                         default_repeats=None, default_skips=None,
+                         skip_transition=None, animation_info_dict=None,
                          reset=False):
         """
         Update an animation while preserving its sequence and state.
@@ -674,13 +1222,17 @@ class TomoAnimationLib():
                 Defaults to False.
             default_repeats (int, optional): Number of times to repeat each
                 frame if no frame repeats were specified for that frame in the
-                playback list. Defaults to 1.
+                playback list. Defaults to None. Leave as default to keep the
+                animation's current setting.
             default_skips (int, optional): Number of times to advance the
-                animation iterator on each advance call. Defaults to 1.
+                animation iterator on each advance call. Defaults to None.
+                Leave as default to keep the animation's current setting.
             skip_transition (bool, optional): If True, animation will skip
-                playing its transition. Defaults to False.
-            animation_info_dict (dict, optional): Pass in a `dict` object
-                to track animation info. Defaults to None.
+                playing its transition. Defaults to None. Leave as default to
+                keep the animation's current setting.
+            animation_info_dict (dict or :class:`~TomoAnimation.AnimationInfo`,
+                optional): Pass in a `dict` or `AnimationInfo` object to track
+                animation info. Defaults to None.
             reset (bool, optional): Reset animation's sequence, and play from
                 beginning. Defaults to False.
 
@@ -720,9 +1272,12 @@ class TomoAnimationLib():
 
         # Reload frame library for specified animation if needed
         # This also checks if the animation exists within the library!
+        if skip_transition is None:
+            skip_transition = animation.skip_transition
+
         try:
-            if name not in self.animation_frame_lib or rescale_tuple:
-                self._load_animation(name, rescale_tuple, stretch)
+            self._require_animation(name, skip_transition, rescale_tuple,
+                                    stretch)
         except Exception as e:
             logger.error(e)
 
@@ -731,7 +1286,7 @@ class TomoAnimationLib():
             self.animation_frame_lib[name]['transition']['playback'] \
                 = transition_playback
         if idle_playback:
-            self.animation_frame_lib[name]['transition']['playback'] \
+            self.animation_frame_lib[name]['idle']['playback'] \
                 = idle_playback
 
         animation.update(self.animation_frame_lib[name],
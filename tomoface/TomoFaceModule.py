@@ -24,11 +24,12 @@ Runs two threads:
 try:
     from .pid import PIDController
     from .utils import add_animations, add_single_animation, \
-                       parse_animation_path, load_images
+                       parse_animation_path, load_images, clear_scaled_cache
 except:
     pass
 
-from threading import Thread, Lock
+from itertools import chain, cycle, repeat
+from threading import Event, Thread, Lock
 
 import pkg_resources
 import time
@@ -89,6 +90,9 @@ class TomoFaceModule():
                  stretch_face=False):
 
         self.lock = Lock()
+        self.frame_lock = Lock() # Only guards handing frames to the display thread
+        self.frame_ready = Event() # Set once the first eyes frame is out
+        self.stop_event = Event() # Backs stop_pygame, so waits can end early
 
         self.pygame_running = False
         self.display_running = False
@@ -149,13 +153,23 @@ class TomoFaceModule():
         ## Overlay Image Params
         self.overlay_image_flag = overlay_image
         self.overlay_image_offset = overlay_image_offset
-        self.overlay_image = pygame.Surface((self.resolution[0], self.resolution[1]))
         self.surface_mode = surface_mode
-        self.output_surface = pygame.Surface((self.resolution[0], self.resolution[1]))
+
+        # Only allocate full-resolution buffers that will actually be used
+        if overlay_image:
+            self.overlay_image = pygame.Surface((self.resolution[0], self.resolution[1]))
+        else:
+            self.overlay_image = None
+
+        if surface_mode:
+            self.output_surface = pygame.Surface((self.resolution[0], self.resolution[1]))
+        else:
+            self.output_surface = None
 
         ## Init animation library
         self.animation_lib = {}
         self.animation_path_lib = {}
+        self.playback_lib = {}
         self.animation_path = animation_path
 
         ## Init starting animations
@@ -165,8 +179,12 @@ class TomoFaceModule():
 
         # All changes are made to prior, before being processed to the final one
         # This is to ensure there is always a lossless image being used
+        #
+        # The animation thread writes the next frames, and the display thread
+        # swaps them in as its prior frames at the start of each update
         self.eyes_display_img = None
         self.eyes_display_img_prior = None
+        self.eyes_display_img_next = None
         self.eyes_animation = None
         self.eyes_animation_name = None
         self.eyes_animation_info_dict = {'animation_name': "-",
@@ -177,6 +195,7 @@ class TomoFaceModule():
 
         self.mouth_display_img = None
         self.mouth_display_img_prior = None
+        self.mouth_display_img_next = None
         self.mouth_animation = None
         self.mouth_animation_name = None
         self.mouth_animation_info_dict = {'animation_name': "-",
@@ -215,8 +234,10 @@ class TomoFaceModule():
             (self.display_width, self.display_height) = (self.infoObject.current_w, self.infoObject.current_h)
             self.resolution = (self.display_width, self.display_height)
 
-        # Init clock
+        # Init clocks (one per loop, so each keeps its own frame rate)
         self.clock = pygame.time.Clock()
+        self.animation_clock = pygame.time.Clock()
+        self.blink_clock = pygame.time.Clock()
 
         # Init last command times
         self.last_position_time = 0
@@ -227,19 +248,44 @@ class TomoFaceModule():
         self.pygame_running = True
         self.stop_pygame = False
 
+    def request_stop(self):
+        """Ask the display threads to stop."""
+        self.stop_event.set()
+
+    @property
     def stop_pygame(self):
-        self.stop_pygame = True
+        """Whether the display threads have been asked to stop."""
+        return self.stop_event.is_set()
+
+    @stop_pygame.setter
+    def stop_pygame(self, stop):
+        if stop:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
 
     def set_background_colour(self, colour_tuple):
         self.background_colour = colour_tuple
 
+    def set_overlay_image(self, surface, offset=None):
+        """Show a surface over the face (None hides the overlay)."""
+        if offset is not None:
+            self.overlay_image_offset = offset
+
+        self.overlay_image = surface
+        self.overlay_image_flag = surface is not None
+
     def load_images(self, img_path_list, rescale_tuple=None, stretch=False):
         """Compute and load rescaled images as pygame surfaces."""
         if self.pygame_running:
             if rescale_tuple is None:
                 rescale_tuple = (self.resolution[0] // 2, self.resolution[1] // 2)
 
-            return load_images(img_path_list, rescale_tuple, stretch)
+            # Premultiply alpha once here so per-pixel alpha frames can take
+            # the faster BLEND_PREMULTIPLIED blit path in the display loop
+            return [image.premul_alpha()
+                    if image.get_flags() & pygame.SRCALPHA else image
+                    for image in load_images(img_path_list, rescale_tuple, stretch, share=True)]
         else:
             print("Pygame not started! Call init_pygame() to start!")
             return []
@@ -268,10 +314,13 @@ class TomoFaceModule():
                                       img_path_list, playback_list=[],
                                       rescale_tuple=None):
         """Add and load a single sub-animation."""
-        add_single_animation(name, sub_name, img_path_list, playback_list)
+        self.add_single_animation(name, sub_name, img_path_list, playback_list)
 
-        self.animation_lib[name][sub_name] = self.load_images(img_path_list, rescale_tuple, stretch=self.stretch_face)
-        self.animation_lib[name][sub_name + "_playback"] = playback_list
+        animation_dict = self.animation_lib.setdefault(name, {'transition': [], 'idle': []})
+        animation_dict[sub_name] = self.load_images(img_path_list, rescale_tuple, stretch=self.stretch_face)
+        animation_dict[sub_name + "_playback"] = playback_list
+        self.optimise_animation(name)
+        self._clear_playback(name)
 
     def add_and_load_animations(self, animation_path, verbose=True, rescale_tuple=None):
         """Load and add animations from a given path."""
@@ -298,11 +347,16 @@ class TomoFaceModule():
 
             # And update the visual library
             self.animation_lib[animation_name] = animation_path_dict
+            self.optimise_animation(animation_name)
+            self._clear_playback(animation_name)
 
-    def _animation_generator(self, animation_dict=None, default_delay=1, transition=[], idle=[],
-                            transition_playback_list=[], idle_playback_list=[], skip_transition=False,
-                            animation_info_dict=None, animation_name=""):
-        """Dynamically generate custom animation."""
+    def _precompile_playback(self, animation_name, animation_dict=None, default_delay=1,
+                             transition=[], idle=[],
+                             transition_playback_list=[], idle_playback_list=[]):
+        """Expand an animation into flat transition and idle schedules.
+
+        Each entry is a (frame, state, frame, delay, delay index, name) tuple
+        for one tick, so playing it back is only an index advance."""
         # If animation dictionary is passed, load it
         if not animation_dict is None:
             transition = animation_dict.get('transition', [])
@@ -317,71 +371,101 @@ class TomoFaceModule():
         if len(idle_playback_list) == 0:
             idle_playback_list = [(x, default_delay) for x in range(len(idle))]
 
-        # Play transition
-        if not skip_transition:
-            for frame_index, frame_delay in transition_playback_list:
-                try:
-                    if animation_info_dict:
-                        try:
-                            if animation_name:
-                                animation_info_dict['animation_name'] = animation_name
-                            else:
-                                animation_info_dict['animation_name'] = animation_dict['animation_name']
-                        except Exception as e:
-                            animation_info_dict['animation_name'] = "ERROR"
-
-                        animation_info_dict['state'] = 0
-                        animation_info_dict['frame_delay'] = frame_delay
-                        animation_info_dict['frame'] = frame_index + 1
-
-                    for i in range(frame_delay):
-                        if animation_info_dict:
-                            animation_info_dict['frame_delay_index'] = i + 1
-
-                        yield transition[frame_index]
-
-                except Exception as e:
-                    if animation_info_dict:
-                        animation_info_dict['frame_delay_index'] = -1
-
-                    print("_animation_generator():", e)
-                    print("Transition frame", frame_index,
-                          "for", animation_name, "does not exist!")
-
-                    yield None
-
-        # Play idle on loop
-        while True:
-            for frame_index, frame_delay in idle_playback_list:
-                try:
-                    if animation_info_dict:
-                        try:
-                            if animation_name:
-                                animation_info_dict['animation_name'] = animation_name
-                            else:
-                                animation_info_dict['animation_name'] = animation_dict['animation_name']
-                        except:
-                            animation_info_dict['animation_name'] = "ERROR"
-
-                        animation_info_dict['state'] = 1
-                        animation_info_dict['frame_delay'] = frame_delay
-                        animation_info_dict['frame'] = frame_index + 1
-
-                    for i in range(frame_delay):
-                        if animation_info_dict:
-                            animation_info_dict['frame_delay_index'] = i + 1
-
-                        yield idle[frame_index]
-
-                except Exception as e:
-                    if animation_info_dict:
-                        animation_info_dict['frame_delay_index'] = -1
-
-                    print("_animation_generator():", e)
-                    print("Idle frame", frame_index,
-                          "for", animation_name, "does not exist!")
-
-                    yield None
+        # Resolve the reported animation name once
+        if animation_name:
+            info_name = animation_name
+        elif animation_dict is not None:
+            info_name = animation_dict.get('animation_name', "ERROR")
+        else:
+            info_name = "ERROR"
+
+        def expand(frames, playback_list, state, state_name):
+            """Expand a playback list into one schedule entry per tick."""
+            schedule = []
+
+            for frame_index, frame_delay in playback_list:
+                if frame_delay < 1:  # Nothing to show
+                    continue
+
+                # Missing frames are reported once here and left out
+                if not 0 <= frame_index < len(frames):
+                    print("_precompile_playback():", state_name, "frame", frame_index,
+                          "for", info_name, "does not exist!")
+                    continue
+
+                schedule.extend(zip(repeat(frames[frame_index], frame_delay),
+                                    repeat(state),
+                                    repeat(frame_index + 1),
+                                    repeat(frame_delay),
+                                    range(1, frame_delay + 1),
+                                    repeat(info_name)))
+
+            return schedule
+
+        transition_schedule = expand(transition, transition_playback_list, 0, "Transition")
+        idle_schedule = expand(idle, idle_playback_list, 1, "Idle")
+
+        # Without idle frames, hold the last transition frame instead of stopping
+        if not idle_schedule:
+            if not transition_schedule:
+                raise ValueError(str(info_name) + " has no frames to play!")
+
+            frame, _, frame_number, _, _, _ = transition_schedule[-1]
+            idle_schedule = [(frame, 1, frame_number, 1, 1, info_name)]
+
+        return transition_schedule, idle_schedule
+
+    def _get_playback(self, animation_name, default_delay=1):
+        """Get the precompiled schedules of a loaded animation."""
+        key = (animation_name, default_delay)
+
+        if key not in self.playback_lib:
+            self.playback_lib[key] = self._precompile_playback(
+                "", self.animation_lib[animation_name], default_delay)
+
+        return self.playback_lib[key]
+
+    def _clear_playback(self, animation_name):
+        """Drop the precompiled schedules of an animation after its frames change."""
+        for key in [key for key in self.playback_lib if key[0] == animation_name]:
+            del self.playback_lib[key]
+
+    def _animation_generator(self, animation_dict=None, default_delay=1, transition=[], idle=[],
+                            transition_playback_list=[], idle_playback_list=[], skip_transition=False,
+                            animation_info_dict=None, animation_name="", schedules=None):
+        """Dynamically generate custom animation."""
+        if schedules is None:
+            schedules = self._precompile_playback(animation_name, animation_dict, default_delay,
+                                                  transition, idle,
+                                                  transition_playback_list, idle_playback_list)
+
+        transition_schedule, idle_schedule = schedules
+
+        if skip_transition:
+            transition_schedule = []
+
+        # Play transition once, then idle on loop
+        schedule = chain(transition_schedule, cycle(idle_schedule))
+
+        # Performance mode skips the animation info updates
+        if not animation_info_dict or self.performance_mode:
+            for entry in schedule:
+                yield entry[0]
+
+            return
+
+        for frame, state, frame_number, frame_delay, frame_delay_index, info_name in schedule:
+            # Repeats of a frame only move the delay index along
+            if frame_delay_index > 1:
+                animation_info_dict['frame_delay_index'] = frame_delay_index
+            else:
+                animation_info_dict.update(animation_name=info_name,
+                                           state=state,
+                                           frame_delay=frame_delay,
+                                           frame=frame_number,
+                                           frame_delay_index=frame_delay_index)
+
+            yield frame
 
     def set_position_goal(self, x, y):
         """
@@ -431,6 +515,7 @@ class TomoFaceModule():
 
         self.animation_lib[animation_name] = animation_dict
         self.optimise_animation(animation_name)
+        self._clear_playback(animation_name)
 
     def set_eyes_animation(self, animation_name, default_delay=1, timeout=None,
                            skip_transition=False, force_reset_animation=False,
@@ -451,11 +536,16 @@ class TomoFaceModule():
 
         # Verify animation exists
         if animation_name in self.animation_lib:
+            try:
+                schedules = self._get_playback(animation_name, default_delay)
+            except Exception as e:
+                print("set_eyes_animation():", e)
+                return
+
             self.eyes_animation = self._animation_generator(
-                self.animation_lib[animation_name],
-                default_delay=default_delay,
                 skip_transition=skip_transition,
-                animation_info_dict= self.eyes_animation_info_dict)
+                animation_info_dict=self.eyes_animation_info_dict,
+                schedules=schedules)
         else:
             # TODO: Change this to logging
             print("set_eyes_animation()")
@@ -494,11 +584,16 @@ class TomoFaceModule():
                 print("set_mouth_animation():", e)
                 return
 
+        try:
+            schedules = self._get_playback(animation_name, default_delay)
+        except Exception as e:
+            print("set_mouth_animation():", e)
+            return
+
         self.mouth_animation = self._animation_generator(
-            self.animation_lib[animation_name],
-            default_delay=default_delay,
             skip_transition=skip_transition,
-            animation_info_dict=self.mouth_animation_info_dict)
+            animation_info_dict=self.mouth_animation_info_dict,
+            schedules=schedules)
 
         self.mouth_animation_name = animation_name
 
@@ -529,15 +624,27 @@ class TomoFaceModule():
         self.enable_blink = False
 
     def optimise_animation(self, name):
+        # Without a video mode (e.g. in surface mode) there is no format to match
+        if pygame.display.get_surface() is None:
+            return
+
         try:
             # Convert animation library to appropriate pixel format
-            for image in self.animation_lib[name]['transition']:
-                image = image.convert_alpha(self.display)
-
-            for image in self.animation_lib[name]['idle']:
-                image = image.convert_alpha(self.display)
-        except:
-            pass
+            display = self.display
+
+            # Frames already in the converted format are kept as they are
+            target = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha(display)
+            target_format = (target.get_bitsize(), target.get_masks())
+
+            for sub_name in ['transition', 'idle']:
+                frames = self.animation_lib[name].get(sub_name, [])
+                frames[:] = [image
+                             if image.get_flags() & pygame.SRCALPHA
+                             and (image.get_bitsize(), image.get_masks()) == target_format
+                             else image.convert_alpha(display)
+                             for image in frames]
+        except Exception as e:
+            print("optimise_animation():", e)
 
     def set_blink_animation(self, name, default_delay=1):
         """Set blink animation."""
@@ -553,14 +660,20 @@ class TomoFaceModule():
 
                 self.animation_lib[name] = animation_dict
                 self.optimise_animation(name)
+                self._clear_playback(name)
             except Exception as e:
                 print("set_blink_animation():", e)
 
+        try:
+            schedules = self._precompile_playback(name, idle=self.animation_lib[name]['idle'])
+        except Exception as e:
+            print("set_blink_animation():", e)
+            return
+
         self.blink_animation = self._animation_generator(
-            idle=self.animation_lib[name]['idle'],
             skip_transition=True,
             animation_info_dict=self.eyes_animation_info_dict,
-            animation_name=name)
+            schedules=schedules)
         self.blink_animation_name = name
 
     def set_eyes_neutral_animation_name(self, name):
@@ -593,6 +706,10 @@ class TomoFaceModule():
 
     def set_resolution(self, resolution, mode=None):
         """Set display resolution via (width, height)."""
+        # Rescales for the old resolution won't be used again
+        if tuple(resolution) != tuple(self.resolution):
+            clear_scaled_cache()
+
         self.resolution = resolution
 
         if mode:
@@ -613,6 +730,10 @@ class TomoFaceModule():
         """
         if self.surface_mode:
             self.display = pygame.Surface(self.resolution)
+
+            if self.output_surface is None or self.output_surface.get_size() != self.display.get_size():
+                self.output_surface = pygame.Surface(self.resolution)
+
             self.init_animations()
             return
 
@@ -642,13 +763,13 @@ class TomoFaceModule():
         # Re-init display dimensions
         # self.display_width, self.display_height = self.resolution
 
-        self.output_surface = pygame.Surface((self.resolution[0], self.resolution[1]))
         self.init_animations()
 
     def init_animations(self):
         with self.lock:
             # Init animations
             self.animation_lib = {}
+            self.playback_lib = {}
 
             if self.enable_blink:
                 self.set_blink_animation(self.blink_animation_name)
@@ -659,17 +780,20 @@ class TomoFaceModule():
     def play_blink(self, blink_delay=None):
         """Blink!"""
         try:
+            if blink_delay:
+                blink_fps = 1000 * self.blink_fps / blink_delay
+            else:
+                blink_fps = self.blink_fps
+
+            # Start timing from now, not from the previous blink
+            self.blink_clock.tick()
+
             for i in range(len(self.animation_lib[self.blink_animation_name]['idle'])):
                 if not self.enable_blink:
                     break
 
                 self._advance_eyes_animation(blink=True)
-
-                if blink_delay:
-                    print(blink_delay)
-                    pygame.time.delay(blink_delay // self.blink_fps)
-                else:
-                    pygame.time.delay(1000 // self.blink_fps)
+                self.blink_clock.tick(blink_fps)
         except Exception as e:
             print("play_blink():", e)
 
@@ -701,78 +825,128 @@ class TomoFaceModule():
         """Step eye animation forward one frame."""
         try:
             if blink:
-                self.eyes_display_img_prior = next(self.blink_animation)
+                frame = next(self.blink_animation)
             else:
-                self.eyes_display_img_prior = next(self.eyes_animation)
+                frame = next(self.eyes_animation)
+
+            with self.frame_lock:
+                self.eyes_display_img_next = frame
 
-            self.eyes_width = self.eyes_display_img_prior.get_width()
-            self.eyes_height = self.eyes_display_img_prior.get_height()
+            if not self.frame_ready.is_set():
+                self.frame_ready.set()
         except Exception as e:
             print("_advance_eyes_animation():", e)
 
     def _advance_mouth_animation(self):
         """Step mouth animation forward one frame."""
         if self.no_mouth:
-            self.mouth_display_img_prior = self.eyes_display_img_prior
-
-            self.mouth_width = self.eyes_display_img_prior.get_width()
-            self.mouth_height = self.eyes_display_img_prior.get_height()
+            with self.frame_lock:
+                self.mouth_display_img_next = self.eyes_display_img_next
         else:
             try:
-                self.mouth_display_img_prior = next(self.mouth_animation)
+                frame = next(self.mouth_animation)
 
-                self.mouth_width = self.mouth_display_img_prior.get_width()
-                self.mouth_height = self.mouth_display_img_prior.get_height()
+                with self.frame_lock:
+                    self.mouth_display_img_next = frame
             except Exception as e:
                 print("_advance_mouth_animation():", e)
 
+    def _swap_display_frames(self):
+        """Take the latest frames from the animation thread as the prior frames."""
+        with self.frame_lock:
+            eyes, mouth = self.eyes_display_img_next, self.mouth_display_img_next
+
+        if eyes is not None:
+            self.eyes_display_img_prior = eyes
+            self.eyes_width, self.eyes_height = eyes.get_size()
+
+        if mouth is not None:
+            self.mouth_display_img_prior = mouth
+            self.mouth_width, self.mouth_height = mouth.get_size()
+
     def _animation_advance_thread(self):
         """Update which images are used for eyes and mouth."""
         if self.enable_blink:
             self.set_blink_animation(self.blink_animation_name)
 
+        get_ticks = pygame.time.get_ticks
+        advance_eyes = self._advance_eyes_animation
+        advance_mouth = self._advance_mouth_animation
+        animation_tick = self.animation_clock.tick
+        stopped = self.stop_event.is_set
+
         # tomo blink animation
         while self.pygame_running and self.display_running:
-            if self.stop_pygame == True:
+            if stopped():
                 print("BLINK CYCLER TERMINATED")
                 break
 
             # tomo_blink enables blinking animations
             if self.enable_blink:
-                blink_time_to_wait = random.uniform(3, 7)
-                self.last_blink_time = pygame.time.get_ticks()
+                blink_time_to_wait = random.uniform(3, 7) * 1000
+                self.last_blink_time = get_ticks()
 
                 # Play transition-idle animation for some time
-                while pygame.time.get_ticks() - self.last_blink_time < blink_time_to_wait * 1000:
-                    self._advance_eyes_animation()
-                    self._advance_mouth_animation()
-                    pygame.time.delay(1000 // self.animation_fps)
+                # (last_blink_time is re-read, as blink requests and no_blink move it)
+                while get_ticks() - self.last_blink_time < blink_time_to_wait \
+                      and self.display_running and not stopped():
+                    advance_eyes()
+                    advance_mouth()
+                    animation_tick(self.animation_fps)
 
                 self.play_blink() # Blocking!
+                animation_tick() # Don't count the blink as a frame
 
                 # Random chance to blink again
                 if random.randint(0, 1) == 1:
-                    blink_time_to_wait = random.uniform(0.5, 3)
-                    self.last_blink_time = pygame.time.get_ticks()
+                    blink_time_to_wait = random.uniform(0.5, 3) * 1000
+                    self.last_blink_time = get_ticks()
 
                     # Play transition-idle animation for some time
-                    while pygame.time.get_ticks() - self.last_blink_time < blink_time_to_wait * 1000:
-                        self._advance_eyes_animation()
-                        self._advance_mouth_animation()
-                        pygame.time.delay(1000 // self.animation_fps)
+                    while get_ticks() - self.last_blink_time < blink_time_to_wait \
+                          and self.display_running and not stopped():
+                        advance_eyes()
+                        advance_mouth()
+                        animation_tick(self.animation_fps)
 
                     self.play_blink() # Blocking!
+                    animation_tick() # Don't count the blink as a frame
             else:
-                self._advance_eyes_animation()
-                self._advance_mouth_animation()
-                pygame.time.delay(1000 // self.animation_fps)
+                advance_eyes()
+                advance_mouth()
+                animation_tick(self.animation_fps)
 
         self.display_running = False
 
+    def _squash(self, surface, size):
+        """Scale a face frame to its squashed size (None for no squash)."""
+        if size is None:
+            return surface
+
+        try:
+            if self.performance_mode:
+                return pygame.transform.scale(surface, size)
+            else:
+                return pygame.transform.smoothscale(surface, size)
+        except Exception as e:
+            print(e)
+            return surface
+
+    def _blit_flags(self, surface):
+        """Get blit flags for a face frame (only per-pixel alpha frames are premultiplied)."""
+        # BLEND_PREMULTIPLIED ignores colour keys, so other frames blit normally
+        if surface.get_flags() & pygame.SRCALPHA:
+            return pygame.BLEND_PREMULTIPLIED
+
+        return 0
+
     def _display_update_thread(self):
         """Handle face movement controls, squishing, and display updates."""
-        while self.eyes_display_img_prior is None:
-            pass
+        while not self.frame_ready.wait(0.1):
+            if self.stop_event.is_set() or not self.display_running:
+                return
+
+        self._swap_display_frames()
 
         # Init controller variables
         (x, y) = self.calculate_blit_for_center(self.eyes_display_img_prior)
@@ -785,20 +959,38 @@ class TomoFaceModule():
         self.y = y # Init blit input
 
         last_blit_rects = []
+        painted = None # (display, background colour) last painted in full
+        drawn = None # What was drawn last frame, to skip identical redraws
+
+        get_ticks = pygame.time.get_ticks
+
+        # Only these events are handled. In window mode the queue is ours, so
+        # high rate motion events are blocked and anything else left unread is
+        # dropped every frame, so a full queue can't drop QUIT or KEYDOWN. In
+        # surface mode the queue may belong to a host application, so other
+        # events are left for whatever else reads it.
+        handled_events = [pygame.QUIT, pygame.KEYDOWN,
+                          pygame.MOUSEBUTTONDOWN, pygame.VIDEORESIZE]
+
+        if not self.surface_mode:
+            pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.FINGERMOTION,
+                                      pygame.JOYAXISMOTION])
+
+        while self.pygame_running and not self.stop_event.is_set() and self.display_running:
+            self._swap_display_frames()
 
-        while self.pygame_running and not self.stop_pygame and self.display_running:
             # Handle events
-            for event in pygame.event.get():
+            for event in pygame.event.get(handled_events):
                 # If pygame crashes or the user closed the window, quit
                 if event.type == pygame.QUIT:
                     if not self.surface_mode:
-                        self.stop_pygame = True
+                        self.request_stop()
                         break
 
                 # Handle one-time keypress events
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_q:
-                        self.stop_pygame = True
+                        self.request_stop()
                         break
 
                     elif event.key == pygame.K_m:
@@ -827,7 +1019,12 @@ class TomoFaceModule():
                     except Exception as e:
                         print(e)
 
-            if self.resize_buffer and pygame.time.get_ticks() - self.last_resize_time > 3000:
+            if not self.surface_mode:
+                pygame.event.clear()
+
+            now = get_ticks()
+
+            if self.resize_buffer and now - self.last_resize_time > 3000:
                 # Filter out minor resizes
                 if max(abs(self.resize_buffer[0] - self.resolution[0]),
                        abs(self.resize_buffer[1] - self.resolution[1])) > 10:
@@ -836,7 +1033,7 @@ class TomoFaceModule():
                     self.set_resolution(self.resize_buffer)
                     self.resize_buffer = None
 
-                self.last_resize_time = pygame.time.get_ticks()
+                self.last_resize_time = get_ticks()
 
             # Grab held keys
             keys = pygame.key.get_pressed()
@@ -860,16 +1057,16 @@ class TomoFaceModule():
 
             if not key_pressed:
                 # If there have been no recent position commands, center face
-                if pygame.time.get_ticks() - self.last_position_time > self.position_timeout:
+                if now - self.last_position_time > self.position_timeout:
                     (self.x_goal, self.y_goal) = self.calculate_blit_for_center(self.eyes_display_img_prior)
 
             # If timeout for either eyes or mouth animation has been reached,
             # reset them to the current neutral state (unless they are already there)
-            if pygame.time.get_ticks() - self.last_eyes_animation_time > self.eyes_animation_timeout:
+            if now - self.last_eyes_animation_time > self.eyes_animation_timeout:
                 if self.eyes_animation_name != self.eyes_neutral_animation_name:
                     self.set_eyes_animation(self.eyes_neutral_animation_name, skip_transition=self.skip_neutral_transition)
 
-            if pygame.time.get_ticks() - self.last_mouth_animation_time > self.mouth_animation_timeout:
+            if now - self.last_mouth_animation_time > self.mouth_animation_timeout:
                 if self.mouth_animation_name != self.mouth_neutral_animation_name:
                     self.set_mouth_animation(self.mouth_neutral_animation_name, skip_transition=self.skip_neutral_transition)
 
@@ -931,13 +1128,7 @@ class TomoFaceModule():
                 x_eyes_shf = self.x - (squashed_eyes_x - self.eyes_width) / 2
                 y_eyes_shf = self.y + (self.eyes_height - squashed_eyes_y) # Compensate for translation due to scale
 
-                try:
-                    if self.performance_mode:
-                        self.eyes_display_img = pygame.transform.scale(self.eyes_display_img_prior, (int(squashed_eyes_x), int(squashed_eyes_y))) #display_height // 2))
-                    else:
-                        self.eyes_display_img = pygame.transform.smoothscale(self.eyes_display_img_prior, (int(squashed_eyes_x), int(squashed_eyes_y))) #display_height // 2))
-                except Exception as e:
-                    print(e)
+                eyes_squash_size = (int(squashed_eyes_x), int(squashed_eyes_y))
 
             # Squash eyes if face is near the top of the screen
             elif y_face_top < y_lower_squash_limit:
@@ -948,16 +1139,10 @@ class TomoFaceModule():
                 x_eyes_shf = self.x - (squashed_eyes_x - self.eyes_width) / 2
                 y_eyes_shf = self.y
 
-                try:
-                    if self.performance_mode:
-                        self.eyes_display_img = pygame.transform.scale(self.eyes_display_img_prior, (int(squashed_eyes_x), int(squashed_eyes_y))) #display_height // 2))
-                    else:
-                        self.eyes_display_img = pygame.transform.smoothscale(self.eyes_display_img_prior, (int(squashed_eyes_x), int(squashed_eyes_y))) #display_height // 2))
-                except Exception as e:
-                    print(e)
+                eyes_squash_size = (int(squashed_eyes_x), int(squashed_eyes_y))
 
             else:
-                self.eyes_display_img = self.eyes_display_img_prior
+                eyes_squash_size = None
                 x_eyes_shf = self.x
                 y_eyes_shf = self.y
 
@@ -973,13 +1158,7 @@ class TomoFaceModule():
                     x_mouth_shf = x_mouth - (squashed_mouth_x - self.mouth_width) / 2
                     y_mouth_shf = y_mouth + (self.mouth_height - squashed_mouth_y) # Compensate for translation due to scale
 
-                    try:
-                        if self.performance_mode:
-                            self.mouth_display_img = pygame.transform.scale(self.mouth_display_img_prior, (int(squashed_mouth_x), int(squashed_mouth_y)))
-                        else:
-                            self.mouth_display_img = pygame.transform.smoothscale(self.mouth_display_img_prior, (int(squashed_mouth_x), int(squashed_mouth_y)))
-                    except Exception as e:
-                        print(e)
+                    mouth_squash_size = (int(squashed_mouth_x), int(squashed_mouth_y))
 
                 # Squash mouth if they're near the top of the screen
                 elif y_face_top < y_lower_squash_limit:
@@ -990,26 +1169,54 @@ class TomoFaceModule():
                     x_mouth_shf = x_mouth - (squashed_mouth_x - self.mouth_width) / 2
                     y_mouth_shf = y_mouth
 
-                    try:
-                        if self.performance_mode:
-                            self.mouth_display_img = pygame.transform.scale(self.mouth_display_img_prior, (int(squashed_mouth_x), int(squashed_mouth_y)))
-                        else:
-                            self.mouth_display_img = pygame.transform.smoothscale(self.mouth_display_img_prior, (int(squashed_mouth_x), int(squashed_mouth_y)))
-                    except Exception as e:
-                        print(e)
+                    mouth_squash_size = (int(squashed_mouth_x), int(squashed_mouth_y))
 
                 else:
-                    self.mouth_display_img = self.mouth_display_img_prior
+                    mouth_squash_size = None
                     x_mouth_shf = x_mouth
                     y_mouth_shf = y_mouth
 
-            # Fill the screen with white
-            self.display.fill(self.background_colour)
+            # Compute bob (no bob by default, so skip the sine)
+            if self.bob_amount:
+                bob = self.bob_amount * (math.sin(now / 1000
+                                         * 2 * math.pi
+                                         * self.bob_frequency))
+            else:
+                bob = 0
+
+            # Repaint the whole background after a display or colour change,
+            # otherwise only clear where the face was drawn last frame
+            full_update = painted != (self.display, self.background_colour)
+
+            # Frames repeat when motion_fps is above animation_fps, so if the
+            # same frames would be drawn at the same squash and (whole pixel)
+            # positions, there is nothing to redraw (or rescale)
+            to_draw = (self.eyes_display_img_prior, eyes_squash_size,
+                       int(x_eyes_shf), int(y_eyes_shf + bob))
+
+            if not self.no_mouth:
+                to_draw += (self.mouth_display_img_prior, mouth_squash_size,
+                            int(x_mouth_shf), int(y_mouth_shf + bob))
+
+            # (The overlay can be drawn on in place, so always redraw with one)
+            if not full_update and not self.overlay_image_flag and to_draw == drawn:
+                self.clock.tick(self.motion_fps)
+                continue
 
-            # Compute bob
-            bob = self.bob_amount * (math.sin(pygame.time.get_ticks() / 1000
-                                     * 2 * math.pi
-                                     * self.bob_frequency))
+            drawn = to_draw
+
+            # Squash the frames that are near the screen edges
+            self.eyes_display_img = self._squash(self.eyes_display_img_prior, eyes_squash_size)
+
+            if not self.no_mouth:
+                self.mouth_display_img = self._squash(self.mouth_display_img_prior, mouth_squash_size)
+
+            if full_update:
+                self.display.fill(self.background_colour)
+                painted = (self.display, self.background_colour)
+            else:
+                for rect in last_blit_rects:
+                    self.display.fill(self.background_colour, rect)
 
             # Track modified areas
             padding_x = self.display.get_width() // 50
@@ -1019,18 +1226,20 @@ class TomoFaceModule():
             new_blit_rects = []
 
             # Execute the eye translation
-            self.display.blit(self.eyes_display_img, (x_eyes_shf, y_eyes_shf + bob))
+            self.display.blit(self.eyes_display_img, (x_eyes_shf, y_eyes_shf + bob),
+                              special_flags=self._blit_flags(self.eyes_display_img))
             new_blit_rects.append(pygame.Rect((x_eyes_shf - padding_x, y_eyes_shf + bob - padding_y),
                                   (self.eyes_display_img.get_width() + padding_x * 2,
                                    self.eyes_display_img.get_height() + padding_y * 2)))
 
             if not self.no_mouth:
-                self.display.blit(self.mouth_display_img, (x_mouth_shf, y_mouth_shf + bob))
+                self.display.blit(self.mouth_display_img, (x_mouth_shf, y_mouth_shf + bob),
+                                  special_flags=self._blit_flags(self.mouth_display_img))
                 new_blit_rects.append(pygame.Rect((x_mouth_shf - padding_x, y_mouth_shf + bob - padding_y),
                                       (self.mouth_display_img.get_width() + padding_x * 2,
                                        self.mouth_display_img.get_height() + padding_y * 2)))
 
-            if self.overlay_image_flag:
+            if self.overlay_image_flag and self.overlay_image is not None:
                 self.display.blit(self.overlay_image, self.overlay_image_offset)
                 new_blit_rects.append(pygame.Rect(self.overlay_image_offset, self.overlay_image.get_size()))
 
@@ -1042,7 +1251,10 @@ class TomoFaceModule():
                 self.output_surface.blit(self.display, (0,0))
             else:
                 # TODO: OPTION TO ROTATE
-                pygame.display.update(blit_rects)
+                if full_update:
+                    pygame.display.update()
+                else:
+                    pygame.display.update(blit_rects)
 
             self.clock.tick(self.motion_fps)
 
@@ -1053,7 +1265,7 @@ class TomoFaceModule():
 if __name__ == "__main__":
     from pid import PIDController
     from utils import add_animations, add_single_animation, \
-                      parse_animation_path, load_images
+                      parse_animation_path, load_images, clear_scaled_cache
 
     face_module = TomoFaceModule(eyes_neutral_animation_name="happy_eyes",
                                  mouth_neutral_animation_name="happy_mouth", blink_animation_name="blink",
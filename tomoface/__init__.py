@@ -1,3 +1,3 @@
 from .TomoFaceModule import TomoFaceModule
 from .TomoAnimationLib import TomoAnimationLib
-from .TomoAnimation import TomoAnimation
+from .TomoAnimation import TomoAnimation, AnimationInfo
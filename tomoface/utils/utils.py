@@ -1,6 +1,64 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+
 import pygame
 import os
 
+# Shared worker pool for image decodes (pygame releases the GIL while decoding)
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Sub-animation folder names in play order
+_SUB_ANIMATIONS = ("transition", "idle")
+
+# Valid image file extensions
+_IMG_EXTS = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
+
+class _SurfaceCache():
+    """Thread-safe LRU cache of surfaces, bounded by their total pixel bytes."""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # key: (value, bytes)
+        self._bytes = 0
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, surface):
+        size = surface.get_pitch() * surface.get_height()
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            # Drop least recently used entries (but always keep the newest)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+# Decoded source images, keyed by (absolute path, mtime)
+_RAW_CACHE = _SurfaceCache(64 * 1024 * 1024)
+
+# Rescaled images, keyed by (absolute path, mtime, rescale tuple, stretch)
+_SCALED_CACHE = _SurfaceCache(32 * 1024 * 1024)
+
 ################################################################################
 # Helper Functions
 ################################################################################
@@ -8,8 +66,13 @@ import os
 # Source http://www.pygame.org/pcr/transform_scale/
 def aspect_scale(img, rescale_tuple):
     """Get scaled image dimensions while retaining aspect ratio."""
+    return _aspect_size(img.get_size(), tuple(rescale_tuple))
+
+@lru_cache(maxsize=64)
+def _aspect_size(size, rescale_tuple):
+    """Get scaled dimensions for an image size (frames usually share one)."""
     bx, by = rescale_tuple
-    ix,iy = img.get_size()
+    ix,iy = size
 
     if ix > iy:
         scale_factor = bx/float(ix)
@@ -38,37 +101,40 @@ def aspect_scale(img, rescale_tuple):
 
 def is_image_file(filename):
     """Check if a given file is an image file."""
-    return any([filename.endswith(img_type) for img_type in [".jpg", ".png", ".gif"]])
+    return filename.lower().endswith(_IMG_EXTS)
 
-def is_valid_animation(path, verbose=True):
+def is_valid_animation(path, verbose=True, entries=None):
     """Check if a given path is a valid animation folder."""
     try:
-        if "idle" in os.listdir(path) or "transition" in os.listdir(path):
+        if entries is None:
+            entries = set(os.listdir(path))
+
+        if "idle" in entries or "transition" in entries:
             return True
         else:
             if verbose:
                 print(path, "is not a valid animation folder! It needs an /idle or /transition folder!")
             return False
-    except:
+    except OSError:
         return False
 
 def generate_playback_list(data, delimiter=" ", default_delay=1):
     """Parse playback string and generate list of tuples of (frame_index, default_delay)"""
-    if len(data) == 0:
-        return []
-
-    playback_list = data.strip().split("\n")
     output = []
 
-    for row_no, frame in enumerate(playback_list, 1):
-        split_frame = tuple([int(x) for x in frame.strip().split(delimiter)])
+    # Splitting on None also collapses runs of whitespace
+    separator = None if delimiter == " " else delimiter
+
+    for row_no, frame in enumerate(data.splitlines(), 1):
+        split_frame = frame.split(separator)
 
         assert len(split_frame) <= 2, "Frame %d is of invalid form!" % (row_no)
 
-        if len(split_frame) == 1:
-            output.append((split_frame[0], default_delay))
         if len(split_frame) == 2:
-            output.append(split_frame)
+            output.append((int(split_frame[0]), int(split_frame[1])))
+        elif split_frame and split_frame[0].strip():
+            output.append((int(split_frame[0]), default_delay))
+        # Otherwise skip blank lines
 
     return output
 
@@ -76,55 +142,117 @@ def parse_animation_path(path, verbose=True):
     """Find all valid animations in a directory and load them."""
     output = {}
 
-    # Iterate through all possible paths
-    for folder_path in os.listdir(path):
+    # Iterate through all possible paths (one scandir pass per directory)
+    with os.scandir(path) as folders:
+        folders = [entry for entry in folders if entry.is_dir()]
+
+    for folder in folders:
         animation_dict = {'transition': [], 'idle': [], 'transition_playback': [], 'idle_playback': [], 'animation_name': ""}
-        animation_path = path + "/" + folder_path
+        animation_path = folder.path
+
+        try:
+            with os.scandir(animation_path) as sub_folders:
+                sub_folders = {entry.name: entry.path for entry in sub_folders}
+        except OSError as e:
+            print("parse_animation_path():", e)
+            continue
 
         # And only proceed if the animation path is valid
-        if is_valid_animation(animation_path, verbose):
-            for sub_animation in ["transition", "idle"]:
+        if is_valid_animation(animation_path, verbose, sub_folders):
+            animation_dict['animation_name'] = animation_path
+
+            for sub_animation in _SUB_ANIMATIONS:
+                if sub_animation not in sub_folders:
+                    continue
+
                 try:
-                    sub_animation_path = animation_path + "/" + sub_animation + "/"
-                    animation_dict['animation_name'] = animation_path
+                    with os.scandir(sub_folders[sub_animation]) as files:
+                        files = {entry.name: entry.path for entry in files}
 
-                    filenames = os.listdir(sub_animation_path)
-                    frames = [sub_animation_path + frame for frame in filenames if is_image_file(frame)]
+                    frames = [file_path for filename, file_path in files.items() if is_image_file(filename)]
                     frames.sort()
                     animation_dict[sub_animation] = frames
 
-                    if "frames" in filenames:
-                        with open(sub_animation_path + "/frames", "r") as f:
+                    if "frames" in files:
+                        with open(files["frames"], "r") as f:
                             animation_dict[sub_animation + "_playback"] = generate_playback_list(f.read())
-                except Exception as e:
+                # Unreadable folders or files, or malformed playback files
+                except (OSError, ValueError, AssertionError) as e:
                     print("parse_animation_path():", e)
 
-            output[folder_path] = animation_dict
+            output[folder.name] = animation_dict
 
     return output
 
-def load_images(img_path_list, rescale_tuple, stretch=False):
-    """Compute and load rescaled images as pygame surfaces."""
-    if stretch: # Stretch images to fit display
-        return [pygame.transform.smoothscale(pygame.image.load(image),
-                                             rescale_tuple) \
-                for image in img_path_list]
-    else: # Otherwise, preserve aspect ratio
-        return [pygame.transform.smoothscale(pygame.image.load(image), \
-                aspect_scale(pygame.image.load(image), rescale_tuple)) \
-                for image in img_path_list]
+def _raw_key(path):
+    """Get the (absolute path, mtime) an image file is cached by."""
+    abs_path = os.path.abspath(path)
+    return abs_path, os.path.getmtime(abs_path)
+
+def load_raw(path, key=None):
+    """Decode an image once, sharing the decoded surface (do not modify it!)."""
+    if key is None:
+        key = _raw_key(path)
+
+    image = _RAW_CACHE.get(key)
+    if image is None:
+        image = pygame.image.load(key[0])
+        _RAW_CACHE.put(key, image, image)
+
+    return image
+
+def clear_raw_cache():
+    """Drop all shared decoded images."""
+    _RAW_CACHE.clear()
+    _SCALED_CACHE.clear()
+
+def clear_scaled_cache():
+    """Drop all rescaled images (e.g. after a resolution change)."""
+    _SCALED_CACHE.clear()
+
+def load_images(img_path_list, rescale_tuple, stretch=False, share=False):
+    """Compute and load rescaled images as pygame surfaces.
+
+    With share=True, cached surfaces are returned as they are, so they must not be modified."""
+    keys = [_raw_key(path) for path in img_path_list]
+    scale_key = (tuple(rescale_tuple), stretch)
+
+    # Reuse earlier rescales, and only decode the rest
+    output = [_SCALED_CACHE.get(key + scale_key) for key in keys]
+    missing = [i for i, image in enumerate(output) if image is None]
+
+    # Decode in parallel (in order), then scale on the calling thread
+    images = _POOL.map(load_raw,
+                       [img_path_list[i] for i in missing],
+                       [keys[i] for i in missing])
+
+    for i, image in zip(missing, images):
+        if stretch: # Stretch images to fit display
+            size = tuple(rescale_tuple)
+        else: # Otherwise, preserve aspect ratio
+            size = aspect_scale(image, rescale_tuple)
+
+        # Images already at the target size are used as decoded
+        if image.get_size() == size:
+            output[i] = image
+            continue
+
+        output[i] = pygame.transform.smoothscale(image, size)
+        _SCALED_CACHE.put(keys[i] + scale_key, output[i], output[i])
+
+    if not share:
+        output = [image.copy() for image in output]
+
+    return output
 
 def add_single_animation(name, sub_name,
                          img_path_list, playback_list=[],
                          animation_path_lib=None):
     """Add a single sub-animation to an animation path library."""
-    if not animation_path_lib:
-        animation_path_lib = {name: {}}
-    else:
-        if not animation_path_lib.get(name):
-            animation_path_lib = {name: {}}
+    if animation_path_lib is None:
+        animation_path_lib = {}
 
-    animation_path_lib[name][sub_name] = img_path_list
+    animation_path_lib.setdefault(name, {})[sub_name] = img_path_list
     animation_path_lib[name][sub_name + "_playback"] = playback_list
 
     return animation_path_lib